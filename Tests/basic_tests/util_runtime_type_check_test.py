@@ -249,6 +249,29 @@ class RuntimeTypeCheckTest(VmbPyTestCase):
         self.assertRaises(TypeError, func, Err1(), 'str')
         self.assertRaises(TypeError, func, Err2(), 'str')
 
+    def test_callable_method_repeated(self):
+        # Expectation: Passing the same callable multiple times yields the same result each time.
+        # The bound first parameter of a method does not count, even if the underlying function
+        # was checked before.
+        @RuntimeTypeCheckEnable()
+        def func(fn: Callable[[str], None], arg: str) -> str:
+            return fn(arg)
+
+        class Handler:
+            def ok(self, arg):
+                return arg
+
+            def err(self, arg1, arg2):
+                return arg1
+
+        handler = Handler()
+        for _ in range(3):
+            self.assertNoRaise(func, handler.ok, 'str')
+            self.assertRaises(TypeError, func, handler.err, 'str')
+
+        self.assertRaises(TypeError, func, Handler.ok, 'str')
+        self.assertNoRaise(func, Handler().ok, 'str')
+
     def test_callable_lambda(self):
         # Expectation: RuntimeTypeCheck must behave with lambas as with functions
 
@@ -25,8 +25,11 @@ OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 import os
+import threading
 import unittest
 import warnings
+from collections import defaultdict
+from typing import Callable, DefaultDict, Hashable, Iterable, List, Optional
 
 import vmbpy
 
@@ -74,6 +77,42 @@ class VmbPyTestCase(unittest.TestCase):
         VmbPyTestCase.test_cam_id = test_cam_id
 
 
+class Latch:
+    """
+    Countdown latch that frame handlers use to signal a waiting test.
+
+    `wait` returns as soon as `count_down` was called `count` times. If the handler runs into an
+    unexpected error it may hand it to `fail` instead. The waiting test then wakes up immediately
+    and the error is raised from `wait` rather than the test running into its timeout.
+    """
+    def __init__(self, count: int):
+        self._count = count
+        self._error = None
+        self._cv = threading.Condition()
+
+    def count_down(self):
+        with self._cv:
+            if self._count > 0:
+                self._count -= 1
+
+                if self._count == 0:
+                    self._cv.notify_all()
+
+    def fail(self, error: BaseException):
+        with self._cv:
+            self._error = error
+            self._cv.notify_all()
+
+    def wait(self, timeout=None) -> bool:
+        with self._cv:
+            done = self._cv.wait_for(lambda: self._count == 0 or self._error is not None, timeout)
+
+            if self._error is not None:
+                raise self._error
+
+            return done
+
+
 def calculate_acquisition_time(cam: vmbpy.Camera, num_frames: int) -> float:
     """
     Calculate how many seconds it takes to record `num_frames` from `cam` in current configuration.
@@ -85,6 +124,90 @@ def calculate_acquisition_time(cam: vmbpy.Camera, num_frames: int) -> float:
     return num_frames / fps
 
 
+def reset_roi(cam: vmbpy.Camera, roi: Optional[int] = None) -> None:
+    """
+    Set the image size of `cam` to `roi` x `roi` pixels or back to the full sensor if `roi` is None.
+
+    The requested size is rounded down to the increment of the `Width` and `Height` features and
+    clamped to their range. Small images reduce the time needed to acquire and transfer frames.
+
+    WARNING: The cams context must already be entered and the camera must not be streaming!
+    """
+    if roi is None:
+        for name in ('OffsetX', 'OffsetY'):
+            try:
+                cam.get_feature_by_name(name).set(0)
+            except vmbpy.VmbFeatureError:
+                pass
+
+    for name in ('Width', 'Height'):
+        feat = cam.get_feature_by_name(name)
+        min_, max_ = feat.get_range()
+        if roi is None:
+            feat.set(max_)
+        else:
+            inc = feat.get_increment()
+            feat.set(min(max_, max(min_, min_ + (roi - min_) // inc * inc)))
+
+
+def set_newest_only_buffer_handling(cam: vmbpy.Camera) -> None:
+    """
+    Let the first stream of `cam` always deliver the most recently acquired frame.
+
+    Sets the `StreamBufferHandlingMode` feature to `NewestOnly` so that no older frames are waiting
+    in the output queue when a frame is requested. Silently does nothing if the stream does not
+    offer that mode.
+
+    WARNING: The cams context must already be entered as this function tries to access stream
+    features!
+    """
+    try:
+        cam.get_streams()[0].get_feature_by_name('StreamBufferHandlingMode').set('NewestOnly')
+    except vmbpy.VmbFeatureError:
+        pass
+
+
+def set_chunk_features(cam: vmbpy.Camera, enable: bool,
+                       entries: Optional[Iterable[str]] = None) -> None:
+    """
+    Turn all chunks of `cam` on or off. Chunk mode is left active only if `enable` is True.
+
+    `entries` are the `ChunkSelector` entries to change. If None, all available entries are used.
+    Only chunks whose `ChunkEnable` state differs from `enable` are written, as each write is a
+    round trip over the control channel of the camera. Raises `VmbFeatureError` if the camera does
+    not support chunk mode.
+
+    WARNING: The cams context must already be entered and the camera must not be streaming!
+    """
+    mode = cam.get_feature_by_name('ChunkModeActive')
+    selector = cam.get_feature_by_name('ChunkSelector')
+    chunk_enable = cam.get_feature_by_name('ChunkEnable')
+    if entries is None:
+        entries = selector.get_available_entries()
+
+    mode.set(False)
+    for entry in entries:
+        selector.set(entry)
+        if chunk_enable.get() != enable:
+            chunk_enable.set(enable)
+
+    if enable:
+        mode.set(True)
+
+
+def group_features(feats: Iterable[vmbpy.FeatureTypes],
+                   key: Callable[[vmbpy.FeatureTypes], Hashable]) -> DefaultDict[Hashable, List]:
+    """
+    Sort `feats` into lists by the value `key` returns for each feature.
+
+    Looking up the returned dict for a key that no feature maps to gives an empty list.
+    """
+    groups: DefaultDict[Hashable, List] = defaultdict(list)
+    for feat in feats:
+        groups[key(feat)].append(feat)
+    return groups
+
+
 def reset_default_user_set(cam_id: str) -> None:
     try:
         with vmbpy.VmbSystem.get_instance() as vmb:
@@ -24,7 +24,9 @@ CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
 OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
+import itertools
 import multiprocessing
+import multiprocessing.connection
 import os
 import sys
 import threading
@@ -40,24 +42,52 @@ from helpers import VmbPyTestCase, calculate_acquisition_time
 
 
 def dummy_frame_handler(cam: Camera, stream: Stream, frame: Frame):
-    pass
+    # Hand the buffer straight back so the transport layer never runs out of queued frames, even
+    # if a test keeps the stream running for a while
+    cam.queue_frame(frame)
+
+
+def _make_counting_handler(frame_count: int, requeue: bool = False):
+    """Create a frame handler that sets the returned event once `frame_count` frames arrived.
+
+    The handler is a closure instead of a callable object so that everything it touches on each
+    frame is a local or enclosing variable rather than an instance attribute.
+
+    Returns:
+        Tuple of the frame handler and the ``threading.Event`` it sets.
+    """
+    counter = itertools.count(1)
+    done = threading.Event()
+
+    def handler(cam: Camera, stream: Stream, frame: Frame):
+        if next(counter) == frame_count:
+            done.set()
+
+        if requeue:
+            cam.queue_frame(frame)
+
+    return handler, done
 
 
 def _open_camera(id: str,
-                 shutdown_request: multiprocessing.Event):
+                 shutdown_request: multiprocessing.connection.Connection):
     """Helper function to open a camera in a different process via multiprocessing
 
     This function can be used in a process spawned by the multiprocessing library. This allows a
     separate process to open a camera, making tests possible that rely on cameras being accessed
     from different processes. Used e.g. in CamCameraTest.test_permitted_access_mode_is_updated.
 
+    The shutdown request is the receiving end of a ``multiprocessing.Pipe``. Waiting on it blocks
+    in the OS until data arrives, so the process reacts as soon as the request is sent.
+
     Example on how to use:
-    p = multiprocessing.Process(target=_open_camera, args=('<cam-id>', shutdown_event)
+    shutdown_receiver, shutdown_sender = multiprocessing.Pipe(duplex=False)
+    p = multiprocessing.Process(target=_open_camera, args=('<cam-id>', shutdown_receiver)
     p.start()
     # camera is now opened in separate process, maybe some wait time is needed so that an
     # appropriate camera event is received by VmbC.
     # Perform test here
-    shutdown_event.set()
+    shutdown_sender.send_bytes(b'x')
     p.join()
     """
     import vmbpy
@@ -65,10 +95,11 @@ def _open_camera(id: str,
         with vmb.get_camera_by_id(id):
             # Set a timeout so we can be sure the process exits and does not remain as an orphaned
             # process forever
-            shutdown_request.wait(timeout=15)
+            shutdown_request.poll(15)
 
 
-class CamCameraTest(VmbPyTestCase):
+class _CamTestBase(VmbPyTestCase):
+    """Starts VmbSystem and looks up the test camera for each test."""
     def setUp(self):
         self.vmb = VmbSystem.get_instance()
         self.vmb._startup()
@@ -86,6 +117,8 @@ class CamCameraTest(VmbPyTestCase):
         self.cam.set_access_mode(AccessMode.Full)
         self.vmb._shutdown()
 
+
+class CamCameraTest(_CamTestBase):
     def test_camera_context_manager_access_mode(self):
         # Expectation: Entering Context must not throw in cases where the current access mode is
         # within get_permitted_access_modes()
@@ -110,40 +143,17 @@ class CamCameraTest(VmbPyTestCase):
 
     def test_camera_access_mode(self):
         # Expectation: set/get access mode
-        for mode in AccessMode:
+        for mode in (AccessMode.Full, AccessMode.Read, AccessMode.Exclusive):
             self.cam.set_access_mode(mode)
             self.assertEqual(self.cam.get_access_mode(), mode)
 
-    def test_camera_get_id(self):
-        # Expectation: get decoded camera id
-        self.assertTrue(self.cam.get_id())
-
-    def test_camera_get_extended_id(self):
-        # Expectation: get decoded extended camera id
-        self.assertTrue(self.cam.get_extended_id())
-
-    def test_camera_get_name(self):
-        # Expectation: get decoded camera name
-        self.assertTrue(self.cam.get_name())
-
-    def test_camera_get_model(self):
-        # Expectation: get decoded camera model
-        self.assertTrue(self.cam.get_model())
-
-    def test_camera_get_serial(self):
-        # Expectation: get decoded camera serial
-        self.assertTrue(self.cam.get_serial())
-
-    def test_camera_get_permitted_access_modes(self):
-        # Expectation: get currently permitted access modes
-        expected = (AccessMode.None_,
-                    AccessMode.Full,
-                    AccessMode.Read,
-                    AccessMode.Unknown,
-                    AccessMode.Exclusive)
-
-        for mode in self.cam.get_permitted_access_modes():
-            self.assertIn(mode, expected)
+    @unittest.skipUnless(os.getenv('VMBPY_FULL_TESTS'),
+                         'Set VMBPY_FULL_TESTS to also check access modes VmbC does not act on')
+    def test_camera_access_mode_all(self):
+        # Expectation: set/get access mode for every member of AccessMode
+        for mode in AccessMode:
+            self.cam.set_access_mode(mode)
+            self.assertEqual(self.cam.get_access_mode(), mode)
 
     @unittest.skipIf(sys.platform.startswith('linux'),
                      'Multiple VmbSystem startups via Multiprocessing seems to be problematic on '
@@ -161,9 +171,9 @@ class CamCameraTest(VmbPyTestCase):
 
         # Prepare a process that will open the camera for us so we can observe the change in
         # permitted access modes. Must be a separate process, separate thread is not enough.
-        shutdown_request = multiprocessing.Event()
+        shutdown_receiver, shutdown_sender = multiprocessing.Pipe(duplex=False)
         p = multiprocessing.Process(target=_open_camera,
-                                    args=(self.cam.get_id(), shutdown_request))
+                                    args=(self.cam.get_id(), shutdown_receiver))
 
         self.assertIn(AccessMode.Full, self.cam.get_permitted_access_modes())
         # Open camera in separate process to trigger a CameraEvent.Unreachable
@@ -174,27 +184,17 @@ class CamCameraTest(VmbPyTestCase):
         # Camera is now open in separate process. Make sure our permitted access modes reflects this
         self.assertNotIn(AccessMode.Full, self.cam.get_permitted_access_modes())
         # Tell spawned process to close camera and wait for it to shut down
-        shutdown_request.set()
+        shutdown_sender.send_bytes(b'x')
         p.join()
         # Remove the additional change handler we registered
         self.vmb.unregister_camera_change_handler(_device_unreachable_informer)
 
-    def test_camera_get_transport_layer_type(self):
-        # Expectation: returns instance of transport layer for Camera instance
-        self.assertIsInstance(self.cam.get_transport_layer(), TransportLayer)
-
-    def test_camera_get_interface_type(self):
-        # Expectation: returns instance of interface for Camera instance
-        self.assertIsInstance(self.cam.get_interface(), Interface)
-
-    def test_camera_get_interface_id(self):
-        # Expectation: get interface Id this camera is connected to
-        self.assertTrue(self.cam.get_interface_id())
-
     def test_camera_get_streams_type(self):
         # Expectation: returns instances of Stream for Camera instance
         with self.cam:
-            for stream in self.cam.get_streams():
+            streams = self.cam.get_streams()
+            self.assertTrue(streams)
+            for stream in streams:
                 self.assertIsInstance(stream, Stream)
 
     def test_camera_get_local_device_type(self):
@@ -206,9 +206,7 @@ class CamCameraTest(VmbPyTestCase):
         # Expectation: The Frame generator fetches the given number of images.
         with self.cam:
             for expected_frames in (1, 7, 11):
-                count = 0
-                for _ in self.cam.get_frame_generator(expected_frames):
-                    count += 1
+                count = sum(1 for _ in self.cam.get_frame_generator(expected_frames))
                 self.assertEqual(count, expected_frames)
 
     def test_camera_frame_generator_error(self):
@@ -305,8 +303,16 @@ class CamCameraTest(VmbPyTestCase):
         with self.cam:
             self.cam.start_streaming(dummy_frame_handler)
             self.assertEqual(self.cam.is_streaming(), True)
-            # Wait a little bit before stopping the stream again to give camera time to settle
-            time.sleep(0.1)
+            # Give camera time to settle before stopping the stream again. If the camera reports
+            # its acquisition state, stop waiting as soon as it is actually acquiring.
+            try:
+                acquisition_status = self.cam.get_feature_by_name('AcquisitionStatus')
+            except VmbFeatureError:
+                time.sleep(0.1)
+            else:
+                deadline = time.monotonic() + 0.1
+                while not acquisition_status.get() and time.monotonic() < deadline:
+                    time.sleep(0.001)
 
             self.cam.stop_streaming()
             self.assertEqual(self.cam.is_streaming(), False)
@@ -327,20 +333,8 @@ class CamCameraTest(VmbPyTestCase):
     def test_camera_streaming(self):
         # Expectation: A given frame_handler must be executed for each buffered frame.
 
-        class FrameHandler:
-            def __init__(self, frame_count):
-                self.cnt = 0
-                self.frame_count = frame_count
-                self.event = threading.Event()
-
-            def __call__(self, cam: Camera, stream: Stream, frame: Frame):
-                self.cnt += 1
-
-                if self.cnt == self.frame_count:
-                    self.event.set()
-
         frame_count = 10
-        handler = FrameHandler(frame_count)
+        handler, handler_done = _make_counting_handler(frame_count)
 
         with self.cam:
             try:
@@ -350,10 +344,11 @@ class CamCameraTest(VmbPyTestCase):
                     timeout = 1.1 * (1.0 + timeout)
                 except VmbFeatureError:
                     timeout = 5.0
-                self.cam.start_streaming(handler, frame_count)
+                self.cam.start_streaming(handler, frame_count,
+                                         allocation_mode=AllocationMode.AllocAndAnnounceFrame)
 
                 # Wait until the FrameHandler has been executed for each queued frame
-                self.assertTrue(handler.event.wait(timeout),
+                self.assertTrue(handler_done.wait(timeout),
                                 'Handler event was not set. Frame count was not reached')
 
             finally:
@@ -362,23 +357,9 @@ class CamCameraTest(VmbPyTestCase):
     def test_camera_streaming_queue(self):
         # Expectation: A given frame must be reused if it is enqueued again.
 
-        class FrameHandler:
-            def __init__(self, frame_count):
-                self.cnt = 0
-                self.frame_count = frame_count
-                self.event = threading.Event()
-
-            def __call__(self, cam: Camera, stream: Stream, frame: Frame):
-                self.cnt += 1
-
-                if self.cnt == self.frame_count:
-                    self.event.set()
-
-                cam.queue_frame(frame)
-
-        frame_count = 5
+        frame_count = 3
         frame_reuse = 2
-        handler = FrameHandler(frame_count * frame_reuse)
+        handler, handler_done = _make_counting_handler(frame_count * frame_reuse, requeue=True)
 
         with self.cam:
             try:
@@ -388,10 +369,11 @@ class CamCameraTest(VmbPyTestCase):
                     timeout = 1.1 * (1.0 + timeout)
                 except VmbFeatureError:
                     timeout = 5.0
-                self.cam.start_streaming(handler, frame_count)
+                self.cam.start_streaming(handler, frame_count,
+                                         allocation_mode=AllocationMode.AllocAndAnnounceFrame)
 
                 # Wait until the FrameHandler has been executed for each queued frame
-                self.assertTrue(handler.event.wait(timeout))
+                self.assertTrue(handler_done.wait(timeout))
 
             finally:
                 self.cam.stop_streaming()
@@ -421,7 +403,7 @@ class CamCameraTest(VmbPyTestCase):
 
                 cam.queue_frame(frame)
 
-        frame_count = 5
+        frame_count = 3
         handler = FrameHandler(frame_count, self)
         with self.cam:
             try:
@@ -431,7 +413,8 @@ class CamCameraTest(VmbPyTestCase):
                     timeout = 1.1 * (1.0 + timeout)
                 except VmbFeatureError:
                     timeout = 5.0
-                self.cam.start_streaming(handler, frame_count)
+                self.cam.start_streaming(handler, frame_count,
+                                         allocation_mode=AllocationMode.AllocAndAnnounceFrame)
 
                 # Wait until the FrameHandler has been executed for each queued frame
                 self.assertTrue(handler.event.wait(timeout))
@@ -456,16 +439,19 @@ class CamCameraTest(VmbPyTestCase):
 
         with self.cam:
             # Expectation: raise TypeError on passing invalid parameters
-            self.assertRaises(TypeError, self.cam.get_frame, 'hi')
-            self.assertRaises(TypeError, self.cam.get_features_selected_by, 'No Feature')
-            self.assertRaises(TypeError, self.cam.get_features_by_type, 0.0)
-            self.assertRaises(TypeError, self.cam.get_feature_by_name, 0)
-            self.assertRaises(TypeError, self.cam.start_streaming, valid_handler, 'no int')
-            self.assertRaises(TypeError, self.cam.start_streaming, invalid_handler_1)
-            self.assertRaises(TypeError, self.cam.start_streaming, invalid_handler_2)
-            self.assertRaises(TypeError, self.cam.start_streaming, invalid_handler_3)
-            self.assertRaises(TypeError, self.cam.save_settings, 0, PersistType.All)
-            self.assertRaises(TypeError, self.cam.save_settings, 'foo.xml', 'false type')
+            for func, args in ((self.cam.get_frame, ('hi',)),
+                               (self.cam.get_features_selected_by, ('No Feature',)),
+                               (self.cam.get_features_by_type, (0.0,)),
+                               (self.cam.get_feature_by_name, (0,)),
+                               (self.cam.start_streaming, (valid_handler, 'no int')),
+                               (self.cam.start_streaming, (invalid_handler_1,)),
+                               (self.cam.start_streaming, (invalid_handler_2,)),
+                               (self.cam.start_streaming, (invalid_handler_3,)),
+                               (self.cam.save_settings, (0, PersistType.All)),
+                               (self.cam.save_settings, ('foo.xml', 'false type'))):
+                with self.subTest(f'{func.__name__}{args}'):
+                    self.assertRaises(TypeError, func, *args)
+
             for args in (('3',), (1, 'foo')):
                 with self.assertRaises(TypeError):
                     for _ in self.cam.get_frame_generator(*args):
@@ -495,7 +481,8 @@ class CamCameraTest(VmbPyTestCase):
                     timeout = 1.1 * (1.0 + timeout)
                 except VmbFeatureError:
                     timeout = 5.0
-                self.cam.start_streaming(handler, frame_count)
+                self.cam.start_streaming(handler, frame_count,
+                                         allocation_mode=AllocationMode.AllocAndAnnounceFrame)
 
                 # Wait until the FrameHandler has been executed for each queued frame
                 self.assertTrue(handler.event.wait(timeout))
@@ -519,24 +506,64 @@ class CamCameraTest(VmbPyTestCase):
     def test_camera_api_context_sensitivity_inside_context(self):
         # Expectation: Most Camera related functions are only valid then called within the given
         # Context. If called from Outside a runtime error must be raised.
-        self.assertRaises(RuntimeError, self.cam.get_streams)
-        self.assertRaises(RuntimeError, self.cam.get_local_device)
-        self.assertRaises(RuntimeError, self.cam.read_memory)
-        self.assertRaises(RuntimeError, self.cam.write_memory)
-        self.assertRaises(RuntimeError, self.cam.get_all_features)
-        self.assertRaises(RuntimeError, self.cam.get_features_selected_by)
-        self.assertRaises(RuntimeError, self.cam.get_features_by_type)
-        self.assertRaises(RuntimeError, self.cam.get_features_by_category)
-        self.assertRaises(RuntimeError, self.cam.get_feature_by_name)
-        self.assertRaises(RuntimeError, self.cam.get_frame)
-        self.assertRaises(RuntimeError, self.cam.start_streaming)
-        self.assertRaises(RuntimeError, self.cam.stop_streaming)
-        self.assertRaises(RuntimeError, self.cam.queue_frame)
-        self.assertRaises(RuntimeError, self.cam.get_pixel_formats)
-        self.assertRaises(RuntimeError, self.cam.get_pixel_format)
-        self.assertRaises(RuntimeError, self.cam.set_pixel_format)
-        self.assertRaises(RuntimeError, self.cam.save_settings)
-        self.assertRaises(RuntimeError, self.cam.load_settings)
+        for name in ('get_streams', 'get_local_device', 'read_memory', 'write_memory',
+                     'get_all_features', 'get_features_selected_by', 'get_features_by_type',
+                     'get_features_by_category', 'get_feature_by_name', 'get_frame',
+                     'start_streaming', 'stop_streaming', 'queue_frame', 'get_pixel_formats',
+                     'get_pixel_format', 'set_pixel_format', 'save_settings', 'load_settings'):
+            with self.subTest(f'method={name}'):
+                self.assertRaises(RuntimeError, getattr(self.cam, name))
+
         with self.assertRaises(RuntimeError):
             for _ in self.cam.get_frame_generator():
                 pass
+
+
+class CamReadOnlyTest(_CamTestBase):
+    """Tests that only query camera information and never open the camera.
+
+    Kept separate from `CamCameraTest` so that they can be scheduled independently of the tests
+    that need exclusive access to the device (e.g. distributed across worker processes).
+    """
+    def test_camera_get_id(self):
+        # Expectation: get decoded camera id
+        self.assertTrue(self.cam.get_id())
+
+    def test_camera_get_extended_id(self):
+        # Expectation: get decoded extended camera id
+        self.assertTrue(self.cam.get_extended_id())
+
+    def test_camera_get_name(self):
+        # Expectation: get decoded camera name
+        self.assertTrue(self.cam.get_name())
+
+    def test_camera_get_model(self):
+        # Expectation: get decoded camera model
+        self.assertTrue(self.cam.get_model())
+
+    def test_camera_get_serial(self):
+        # Expectation: get decoded camera serial
+        self.assertTrue(self.cam.get_serial())
+
+    def test_camera_get_permitted_access_modes(self):
+        # Expectation: get currently permitted access modes
+        expected = (AccessMode.None_,
+                    AccessMode.Full,
+                    AccessMode.Read,
+                    AccessMode.Unknown,
+                    AccessMode.Exclusive)
+
+        for mode in self.cam.get_permitted_access_modes():
+            self.assertIn(mode, expected)
+
+    def test_camera_get_transport_layer_type(self):
+        # Expectation: returns instance of transport layer for Camera instance
+        self.assertIsInstance(self.cam.get_transport_layer(), TransportLayer)
+
+    def test_camera_get_interface_type(self):
+        # Expectation: returns instance of interface for Camera instance
+        self.assertIsInstance(self.cam.get_interface(), Interface)
+
+    def test_camera_get_interface_id(self):
+        # Expectation: get interface Id this camera is connected to
+        self.assertTrue(self.cam.get_interface_id())
@@ -26,91 +26,131 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 import os
 import sys
-import threading
 
 from vmbpy import *
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from helpers import VmbPyTestCase, calculate_acquisition_time
+from helpers import (Latch, VmbPyTestCase, calculate_acquisition_time, reset_roi,
+                     set_chunk_features)
 
 
 class ChunkAccessTest(VmbPyTestCase):
-    def setUp(self):
-        self.vmb = VmbSystem.get_instance()
-        self.vmb._startup()
+    # Names of the available ChunkSelector entries. Populated on first use.
+    _chunk_entries = None
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Opening the camera is by far the most expensive part of the test setup. Do it once for
+        # the whole class. Every test leaves the camera in the same state it found it in, because
+        # setUp and tearDown toggle the chunk features.
+        cls.vmb = VmbSystem.get_instance()
+        cls.vmb._startup()
 
         try:
-            self.cam = self.vmb.get_camera_by_id(self.get_test_camera_id())
+            cls.cam = cls.vmb.get_camera_by_id(cls.get_test_camera_id())
 
         except VmbCameraError as e:
-            self.vmb._shutdown()
+            cls.vmb._shutdown()
             raise Exception('Failed to lookup Camera.') from e
 
         try:
-            self.cam._open()
-            self.local_device = self.cam.get_local_device()
+            cls.cam._open()
+            cls.local_device = cls.cam.get_local_device()
         except VmbCameraError as e:
-            self.cam._close()
-            raise Exception('Failed to open Camera {}.'.format(self.cam)) from e
+            cls.cam._close()
+            cls.vmb._shutdown()
+            raise Exception('Failed to open Camera {}.'.format(cls.cam)) from e
+
+        # Chunk access does not depend on the image content. A small ROI keeps frames small and
+        # acquisition fast for all tests of this class
+        try:
+            reset_roi(cls.cam, 64)
+        except VmbFeatureError:
+            pass
+
+        # Features are attached to the camera as attributes. Probe once whether chunk mode is
+        # supported instead of failing with an AttributeError in every setUp
+        cls.has_chunk_mode = hasattr(cls.cam, 'ChunkModeActive')
+
+        # The frame rate does not change between tests. Read it once to derive all timeouts
+        try:
+            cls.frame_period = calculate_acquisition_time(cls.cam, 1)
+        except VmbFeatureError:
+            cls.frame_period = None
+
+    @classmethod
+    def tearDownClass(cls):
+        try:
+            reset_roi(cls.cam)
+        except VmbFeatureError:
+            pass
+
+        cls.cam._close()
+        cls.vmb._shutdown()
+        super().tearDownClass()
+
+    def setUp(self):
+        if not self.has_chunk_mode:
+            self.skipTest('Required Feature \'ChunkModeActive\' not available.')
 
         try:
-            self.enable_chunk_features()
+            set_chunk_features(self.cam, True, self.get_chunk_entries())
 
-        except (VmbFeatureError, AttributeError):
-            self.cam._close()
-            self.vmb._shutdown()
+        except VmbFeatureError:
             self.skipTest('Required Feature \'ChunkModeActive\' not available.')
 
     def tearDown(self):
-        self.disable_chunk_features()
-        self.cam._close()
-        self.vmb._shutdown()
-
-    def enable_chunk_features(self):
-        # Turn on all Chunk features
-        self.cam.ChunkModeActive.set(False)
-        for value in self.cam.ChunkSelector.get_available_entries():
-            self.cam.ChunkSelector.set(value)
-            self.cam.ChunkEnable.set(True)
-        self.cam.ChunkModeActive.set(True)
-
-    def disable_chunk_features(self):
-        self.cam.ChunkModeActive.set(False)
-        for value in self.cam.ChunkSelector.get_available_entries():
-            self.cam.ChunkSelector.set(value)
-            self.cam.ChunkEnable.set(False)
+        set_chunk_features(self.cam, False, self.get_chunk_entries())
+
+    def acquisition_timeout(self, frame_count: int) -> float:
+        if self.frame_period is None:
+            return 5.0
+
+        # Add one second extra time for acquisition overhead and additional 10% buffer
+        return 1.1 * (1.0 + frame_count * self.frame_period)
+
+    def get_chunk_entries(self):
+        # The available ChunkSelector entries do not change between tests. Query them once and
+        # keep their names, as EnumEntry instances are bound to the handle of the opened camera.
+        cls = type(self)
+        if cls._chunk_entries is None:
+            entries = self.cam.ChunkSelector.get_available_entries()
+            cls._chunk_entries = tuple(str(e) for e in entries)
+
+        return cls._chunk_entries
 
     def test_chunk_callback_is_executed(self):
         # Expectation: The chunk callback is executed for every call to `Frame.access_chunk_data`
         class FrameHandler:
             def __init__(self, frame_limit) -> None:
-                self.frame_limit = frame_limit
                 self.frame_callbacks_executed = 0
                 self.chunk_callbacks_executed = 0
-                self.is_done = threading.Event()
+                self.is_done = Latch(frame_limit)
+                # Bind the chunk callback once instead of on every frame
+                self._chunk_cb = self.chunk_callback
 
             def __call__(self, cam: Camera, stream: Stream, frame: Frame):
                 self.frame_callbacks_executed += 1
-                frame.access_chunk_data(self.chunk_callback)
-                stream.queue_frame(frame)
-
-                if self.frame_callbacks_executed >= self.frame_limit:
-                    self.is_done.set()
+                try:
+                    frame.access_chunk_data(self._chunk_cb)
+                    stream.queue_frame(frame)
+                except Exception as e:
+                    # Let the test fail right away instead of waiting for the timeout
+                    self.is_done.fail(e)
+                else:
+                    self.is_done.count_down()
 
             def chunk_callback(self, feats: FeatureContainer):
                 self.chunk_callbacks_executed += 1
 
-        frame_count = 5
+        frame_count = 2
         handler = FrameHandler(frame_count)
         try:
-            try:
-                timeout = calculate_acquisition_time(self.cam, frame_count)
-                # Add one second extra time for acquisition overhead and additional 10% buffer
-                timeout = 1.1 * (1.0 + timeout)
-            except VmbFeatureError:
-                timeout = 5.0
-            self.cam.start_streaming(handler)
+            timeout = self.acquisition_timeout(frame_count)
+            self.cam.start_streaming(handler, buffer_count=3,
+                                     allocation_mode=AllocationMode.AnnounceFrame)
             self.assertTrue(handler.is_done.wait(timeout=timeout),
                             'Frame handler did not finish before timeout')
         finally:
@@ -167,31 +207,27 @@ class ChunkAccessTest(VmbPyTestCase):
         class FrameHandler:
             def __init__(self, test_instance: VmbPyTestCase) -> None:
                 self.expected_exception_raised = False
-                self.is_done = threading.Event()
+                self.is_done = Latch(1)
+                self._chunk_cb = self.chunk_callback
 
             def __call__(self, cam: Camera, stream: Stream, frame: Frame):
                 try:
-                    frame.access_chunk_data(self.chunk_callback)
+                    frame.access_chunk_data(self._chunk_cb)
                 except VmbFrameError:
                     self.expected_exception_raised = True
                 finally:
-                    self.is_done.set()
+                    self.is_done.count_down()
 
             def chunk_callback(self, feats: FeatureContainer):
                 # Will never be called because the C-API raises an error before we get this far
                 pass
 
-        self.disable_chunk_features()
+        set_chunk_features(self.cam, False, self.get_chunk_entries())
         handler = FrameHandler(self)
         try:
-            try:
-                frame_count = 1
-                timeout = calculate_acquisition_time(self.cam, frame_count)
-                # Add one second extra time for acquisition overhead and additional 10% buffer
-                timeout = 1.1 * (1.0 + timeout)
-            except VmbFeatureError:
-                timeout = 5.0
-            self.cam.start_streaming(handler)
+            timeout = self.acquisition_timeout(1)
+            self.cam.start_streaming(handler, buffer_count=3,
+                                     allocation_mode=AllocationMode.AnnounceFrame)
             self.assertTrue(handler.is_done.wait(timeout=timeout),
                             'Frame handler did not finish before timeout')
         finally:
@@ -209,31 +245,27 @@ class ChunkAccessTest(VmbPyTestCase):
             def __init__(self) -> None:
                 self.expected_exception_raised = False
                 self.exception_message_as_expected = False
-                self.is_done = threading.Event()
+                self.is_done = Latch(1)
+                self._chunk_cb = self.chunk_callback
                 self.__exception_message = 'foo'
 
             def __call__(self, cam: Camera, stream: Stream, frame: Frame):
                 try:
-                    frame.access_chunk_data(self.chunk_callback)
+                    frame.access_chunk_data(self._chunk_cb)
                 except _CustomException as e:
                     self.expected_exception_raised = True
                     self.exception_message_as_expected = str(e) == self.__exception_message
                 finally:
-                    self.is_done.set()
+                    self.is_done.count_down()
 
             def chunk_callback(self, feats: FeatureContainer):
                 raise _CustomException(self.__exception_message)
 
         handler = FrameHandler()
         try:
-            try:
-                frame_count = 1
-                timeout = calculate_acquisition_time(self.cam, frame_count)
-                # Add one second extra time for acquisition overhead and additional 10% buffer
-                timeout = 1.1 * (1.0 + timeout)
-            except VmbFeatureError:
-                timeout = 5.0
-            self.cam.start_streaming(handler)
+            timeout = self.acquisition_timeout(1)
+            self.cam.start_streaming(handler, buffer_count=3,
+                                     allocation_mode=AllocationMode.AnnounceFrame)
             self.assertTrue(handler.is_done.wait(timeout=timeout),
                             'Frame handler did not finish before timeout')
         finally:
@@ -251,21 +283,20 @@ class ChunkAccessTest(VmbPyTestCase):
 
         class FrameHandler:
             def __init__(self, frame_limit) -> None:
-                self.frame_limit = frame_limit
                 self.__frame_count = 0
                 self.exception_was_raised_once = False
                 self.later_access_worked = False
-                self.is_done = threading.Event()
+                self.is_done = Latch(frame_limit)
+                self._chunk_cb = self.chunk_callback
 
             def __call__(self, cam: Camera, stream: Stream, frame: Frame):
                 try:
-                    frame.access_chunk_data(self.chunk_callback)
+                    frame.access_chunk_data(self._chunk_cb)
                 except _CustomException:
                     self.exception_was_raised_once = True
                 finally:
                     self.__frame_count += 1
-                    if self.__frame_count >= self.frame_limit:
-                        self.is_done.set()
+                    self.is_done.count_down()
 
             def chunk_callback(self, feats: FeatureContainer):
                 if self.__frame_count == 0:
@@ -273,16 +304,12 @@ class ChunkAccessTest(VmbPyTestCase):
                 if self.exception_was_raised_once:
                     self.later_access_worked = True
 
-        frame_count = 5
+        frame_count = 2
         handler = FrameHandler(frame_count)
         try:
-            try:
-                timeout = calculate_acquisition_time(self.cam, frame_count)
-                # Add one second extra time for acquisition overhead and additional 10% buffer
-                timeout = 1.1 * (1.0 + timeout)
-            except VmbFeatureError:
-                timeout = 5.0
-            self.cam.start_streaming(handler)
+            timeout = self.acquisition_timeout(frame_count)
+            self.cam.start_streaming(handler, buffer_count=3,
+                                     allocation_mode=AllocationMode.AnnounceFrame)
             self.assertTrue(handler.is_done.wait(timeout=timeout),
                             'Frame handler did not finish before timeout')
         finally:
@@ -321,6 +348,6 @@ class ChunkAccessTest(VmbPyTestCase):
     def test_contains_chunk_data_false(self):
         # Expectation: if frame contains no chunk data the function `contains_chunk_data`
         # will return false
-        self.disable_chunk_features()
+        set_chunk_features(self.cam, False, self.get_chunk_entries())
         frame = self.cam.get_frame()
         self.assertFalse(frame.contains_chunk_data())
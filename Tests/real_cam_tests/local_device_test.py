@@ -31,66 +31,74 @@ from vmbpy import *
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from helpers import VmbPyTestCase
+from helpers import VmbPyTestCase, group_features
 
 
 class LocalDeviceTest(VmbPyTestCase):
-    def setUp(self):
-        self.vmb = VmbSystem.get_instance()
-        self.vmb._startup()
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.vmb = VmbSystem.get_instance()
+        cls.vmb._startup()
 
         try:
-            self.cam = self.vmb.get_camera_by_id(self.get_test_camera_id())
+            cls.cam = cls.vmb.get_camera_by_id(cls.get_test_camera_id())
 
         except VmbCameraError as e:
-            self.vmb._shutdown()
+            cls.vmb._shutdown()
             raise Exception('Failed to lookup Camera.') from e
 
         try:
-            self.cam._open()
-            self.local_device = self.cam.get_local_device()
+            cls.cam._open()
         except VmbCameraError as e:
-            self.cam._close()
-            raise Exception('Failed to open Camera {}.'.format(self.cam)) from e
+            cls.cam._close()
+            cls.vmb._shutdown()
+            raise Exception('Failed to open Camera {}.'.format(cls.cam)) from e
 
-    def tearDown(self):
-        # In some test cases the camera might already have been closed. In that case an additional
-        # call to `cam._close` will result in an error. This can be ignored in our test tearDown.
-        try:
-            self.cam._close()
-        except Exception:
-            pass
-        self.vmb._shutdown()
+    @classmethod
+    def tearDownClass(cls):
+        cls.cam._close()
+        cls.vmb._shutdown()
+        super().tearDownClass()
+
+    def setUp(self):
+        # Some test cases close and reopen the camera, which discovers new feature instances. Look
+        # them up for every test so that no test works with stale features
+        self.local_device = self.cam.get_local_device()
+        self.all_features = self.local_device.get_all_features()
+        self.by_category = group_features(self.all_features, lambda f: f.get_category())
+        self.by_type = group_features(self.all_features, lambda f: f.get_type())
 
     def test_local_device_feature_discovery(self):
         # Expectation: Features are detected for the LocalDevice
-        self.assertNotEqual(self.local_device.get_all_features(), ())
+        self.assertNotEqual(self.all_features, ())
 
     def test_local_device_features_category(self):
         # Expectation: Getting features by category for an existing category returns a set of
         # features, for a non-existent category an empty set is returned
-        category = self.local_device.get_all_features()[0].get_category()
-        self.assertNotEqual(self.local_device.get_features_by_category(category), ())
+        category = self.all_features[0].get_category()
+        self.assertTrue(self.by_category[category])
+        self.assertEqual(self.local_device.get_features_by_category(category),
+                         tuple(self.by_category[category]))
         self.assertEqual(self.local_device.get_features_by_category("Invalid Category"), ())
 
     def test_local_device_feature_by_name(self):
         # Expectation: A feature can be gotten by name. Invalid feature names raise a
         # VmbFeatureError
-        feat = self.local_device.get_all_features()[0]
-        self.assertEqual(self.local_device.get_feature_by_name(feat.get_name()), feat)
+        feat = self.all_features[0]
+        self.assertIs(self.local_device.get_feature_by_name(feat.get_name()), feat)
         self.assertRaises(VmbFeatureError, self.local_device.get_feature_by_name, "Invalid Name")
 
     def test_local_device_features_by_type(self):
         # Expectation: Getting features by type returns a set of features for an existing type
-        type = self.local_device.get_all_features()[0].get_type()
-        self.assertNotEqual(self.local_device.get_features_by_type(type), ())
+        type = self.all_features[0].get_type()
+        self.assertTrue(self.by_type[type])
+        self.assertEqual(self.local_device.get_features_by_type(type), tuple(self.by_type[type]))
 
     def test_local_device_features_selected_by(self):
         # Expectation: Selected features can be gotten for a feature instance
-        try:
-            feat = [f for f in self.local_device.get_all_features()
-                    if f.has_selected_features()].pop()
-        except IndexError:
+        feat = next((f for f in self.all_features if f.has_selected_features()), None)
+        if feat is None:
             self.skipTest('Could not find feature with \'selected features\'')
         self.assertNotEqual(self.local_device.get_features_selected_by(feat), ())
 
@@ -98,7 +106,7 @@ class LocalDeviceTest(VmbPyTestCase):
         # Expectation: Call get_all_features outside of Camera context raises a RuntimeError and
         # the error message references the Camera context
         local_device = self.cam.get_local_device()
-        feat = local_device.get_all_features()[0]
+        feat = self.all_features[0]
         feat_name = feat.get_name()
 
         # Ensure that normal calls work while context is still open
@@ -111,28 +119,30 @@ class LocalDeviceTest(VmbPyTestCase):
         # This closes the local device of self.cam implicitly. Alternatively it is possible to call
         # local_device._close here if that implicit behavior should not be relied upon
         self.cam._close()
-        self.assertRaisesRegex(RuntimeError,
-                               'outside of Camera.* context',
-                               local_device.get_all_features)
-
-        self.assertRaisesRegex(RuntimeError,
-                               'outside of Camera.* context',
-                               local_device.get_features_selected_by,
-                               feat)
-
-        self.assertRaisesRegex(RuntimeError,
-                               'outside of Camera.* context',
-                               local_device.get_features_by_type,
-                               IntFeature)
-
-        self.assertRaisesRegex(RuntimeError,
-                               'outside of Camera.* context',
-                               local_device.get_features_by_category,
-                               'foo')
-
-        self.assertRaisesRegex(RuntimeError,
-                               'outside of Camera.* context',
-                               local_device.get_feature_by_name,
-                               feat_name)
-        # open camera context again so tearDown works as expected
-        self.cam._open()
+        try:
+            self.assertRaisesRegex(RuntimeError,
+                                   'outside of Camera.* context',
+                                   local_device.get_all_features)
+
+            self.assertRaisesRegex(RuntimeError,
+                                   'outside of Camera.* context',
+                                   local_device.get_features_selected_by,
+                                   feat)
+
+            self.assertRaisesRegex(RuntimeError,
+                                   'outside of Camera.* context',
+                                   local_device.get_features_by_type,
+                                   IntFeature)
+
+            self.assertRaisesRegex(RuntimeError,
+                                   'outside of Camera.* context',
+                                   local_device.get_features_by_category,
+                                   'foo')
+
+            self.assertRaisesRegex(RuntimeError,
+                                   'outside of Camera.* context',
+                                   local_device.get_feature_by_name,
+                                   feat_name)
+        finally:
+            # open camera context again so following tests find it open
+            self.cam._open()
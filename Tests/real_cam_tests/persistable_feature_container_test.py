@@ -26,6 +26,7 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 import os
 import sys
+import tempfile
 
 from vmbpy import *
 
@@ -33,6 +34,10 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from helpers import VmbPyTestCase
 
+# Members of the enums iterated in the tests below. They never change, so they are collected once
+_PERSIST_TYPES = tuple(PersistType)
+_MODULE_PERSIST_FLAGS = tuple(ModulePersistFlags)
+
 
 class PersistableFeatureContainerTest(VmbPyTestCase):
     @classmethod
@@ -53,10 +58,17 @@ class PersistableFeatureContainerTest(VmbPyTestCase):
         cls.vmb._shutdown()
         super().tearDownClass()
 
+    def setUp(self):
+        # Settings files are written to a temporary directory that is removed after each test. This
+        # keeps the working directory clean even if a test fails before removing its file
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.tmp_dir = tmp_dir.name
+
     def test_camera_save_load(self):
         # Expectation: A modified setting is set back to the saved value when the xml file is loaded
         with self.cam:
-            fname = 'camera.xml'
+            fname = os.path.join(self.tmp_dir, 'camera.xml')
 
             feat_height = self.cam.get_feature_by_name('Height')
 
@@ -73,16 +85,15 @@ class PersistableFeatureContainerTest(VmbPyTestCase):
             # Load saved state from xml file. This should write the old value back to the modified
             # feature
             self.assertNoRaise(self.cam.load_settings, fname)
-            os.remove(fname)
 
             self.assertEqual(old_val, feat_height.get())
 
     def test_stream_save_load(self):
         # Expectation: Settings can be saved to a file and loaded from it.
         with self.cam:
-            for stream in self.cam.get_streams():
+            for i, stream in enumerate(self.cam.get_streams()):
                 with self.subTest(f'stream={str(stream)}'):
-                    fname = 'stream.xml'
+                    fname = os.path.join(self.tmp_dir, f'stream_{i}.xml')
                     self.assertNoRaise(stream.save_settings, fname)
                     self.assertTrue(os.path.isfile(fname))
                     # Room for improvement: Unfortunately there is no generic writeable feature that
@@ -91,13 +102,11 @@ class PersistableFeatureContainerTest(VmbPyTestCase):
                     # if no errors occur assume the test to be passed.
                     self.assertNoRaise(stream.load_settings, fname)
 
-                    os.remove(fname)
-
     def test_local_device_save_load(self):
         # Expectation: Settings can be saved to a file and loaded from it.
         with self.cam:
             local_device = self.cam.get_local_device()
-            fname = 'local_device.xml'
+            fname = os.path.join(self.tmp_dir, 'local_device.xml')
             self.assertNoRaise(local_device.save_settings, fname)
             self.assertTrue(os.path.isfile(fname))
             # Room for improvement: Unfortunately there is no generic writeable feature that every
@@ -106,20 +115,17 @@ class PersistableFeatureContainerTest(VmbPyTestCase):
             # assume the test to be passed.
             self.assertNoRaise(local_device.load_settings, fname)
 
-            os.remove(fname)
-
     def test_persist_types(self):
         # Expectation: All possible persist_types are accepted
         # Note: The content of the XML is not checked!
         # Room for improvement: Check that the content of the xml file actually corresponds with
         # what is expected for each persist type
         with self.cam:
-            fname = 'camera.xml'
-            for t in PersistType:
-                with self.subTest(f'persist_type={str(t)}'):
+            for t in _PERSIST_TYPES:
+                with self.subTest(persist_type=t):
+                    fname = os.path.join(self.tmp_dir, f'camera_{t.name}.xml')
                     self.assertNoRaise(self.cam.save_settings, fname, persist_type=t)
-                    self.assertTrue(os.path.isfile(fname))
-                    os.remove(fname)
+                    self.assertGreater(os.stat(fname).st_size, 0)
 
     def test_persist_flags(self):
         # Expectation: All possible persist_flags are accepted
@@ -127,12 +133,11 @@ class PersistableFeatureContainerTest(VmbPyTestCase):
         # Room for improvement: Check that the content of the xml file actually corresponds with
         # what is expected for each persist flag
         with self.cam:
-            fname = 'camera.xml'
-            for f in ModulePersistFlags:
-                with self.subTest(f'persist_flags={str(f)}'):
+            for f in _MODULE_PERSIST_FLAGS:
+                with self.subTest(flag=f):
+                    fname = os.path.join(self.tmp_dir, f'camera_{f.name}.xml')
                     self.assertNoRaise(self.cam.save_settings, fname, persist_flags=f)
-                    self.assertTrue(os.path.isfile(fname))
-                    os.remove(fname)
+                    self.assertGreater(os.stat(fname).st_size, 0)
 
     def test_persist_flags_combinations(self):
         # Expectation: persist_flags can be combined via logical or
@@ -140,7 +145,6 @@ class PersistableFeatureContainerTest(VmbPyTestCase):
         # Room for improvement: Check that the content of the xml file actually corresponds with
         # what is expected for each persist flag
         with self.cam:
-            fname = 'camera.xml'
             # test some combinations below. Testing all combinations of two flag variables takes
             # very long but can be implemented via this generator:
             # `itertools.product(vmbpy.ModulePersistFlags, repeat=2)`
@@ -148,10 +152,10 @@ class PersistableFeatureContainerTest(VmbPyTestCase):
                          (ModulePersistFlags.RemoteDevice, ModulePersistFlags.Interface),
                          (ModulePersistFlags.RemoteDevice, ModulePersistFlags.TransportLayer),
                          (ModulePersistFlags.Interface, ModulePersistFlags.TransportLayer)):
-                with self.subTest(f'persist_flags={str(a)} | {str(b)}'):
+                with self.subTest(flag=a | b):
+                    fname = os.path.join(self.tmp_dir, f'camera_{a.name}_{b.name}.xml')
                     self.assertNoRaise(self.cam.save_settings, fname, persist_flags=a | b)
-                    self.assertTrue(os.path.isfile(fname))
-                    os.remove(fname)
+                    self.assertGreater(os.stat(fname).st_size, 0)
 
     def test_load_settings_api_context_sensitivity_inside_context(self):
         # Expectation: Calling load_settings outside of VmbSystem context raises a RuntimeError and
@@ -25,15 +25,15 @@ OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 import os
+import re
 import sys
 import threading
-import time
 
 from vmbpy import *
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from helpers import VmbPyTestCase, calculate_acquisition_time
+from helpers import VmbPyTestCase, calculate_acquisition_time, group_features
 
 
 def dummy_frame_handler(cam: Camera, stream: Stream, frame: Frame):
@@ -41,47 +41,79 @@ def dummy_frame_handler(cam: Camera, stream: Stream, frame: Frame):
 
 
 class StreamTest(VmbPyTestCase):
-    def setUp(self):
-        self.vmb = VmbSystem.get_instance()
-        self.vmb._startup()
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.vmb = VmbSystem.get_instance()
+        cls.vmb._startup()
 
         try:
-            self.cam = self.vmb.get_camera_by_id(self.get_test_camera_id())
+            cls.cam = cls.vmb.get_camera_by_id(cls.get_test_camera_id())
 
         except VmbCameraError as e:
-            self.vmb._shutdown()
+            cls.vmb._shutdown()
             raise Exception('Failed to lookup Camera.') from e
 
         try:
-            self.cam._open()
-            self.streams = self.cam.get_streams()
+            cls.cam._open()
         except VmbCameraError as e:
-            self.cam._close()
-            raise Exception('Failed to open Camera {}.'.format(self.cam)) from e
+            cls.cam._close()
+            cls.vmb._shutdown()
+            raise Exception('Failed to open Camera {}.'.format(cls.cam)) from e
+
+        cls.cam_open = True
+
+    @classmethod
+    def tearDownClass(cls):
+        if cls.cam_open:
+            cls.cam._close()
+        cls.vmb._shutdown()
+        super().tearDownClass()
+
+    def setUp(self):
+        # Some test cases close the camera and leave it closed. Reopen it only when the next test
+        # needs it instead of at the end of each of those tests
+        if not self.cam_open:
+            self.cam._open()
+            type(self).cam_open = True
+
+        # Reopening the camera discovers new feature instances. Look them up for every test so that
+        # no test works with stale features
+        self.streams = self.cam.get_streams()
+        self.stream_features = {stream: stream.get_all_features() for stream in self.streams}
+        self.stream_features_by_category = {
+            stream: group_features(feats, lambda f: f.get_category())
+            for stream, feats in self.stream_features.items()
+        }
+        self.stream_features_by_type = {
+            stream: group_features(feats, lambda f: f.get_type())
+            for stream, feats in self.stream_features.items()
+        }
 
     def tearDown(self):
-        # In some test cases the camera might already have been closed. In that case an additional
-        # call to `cam._close` will result in an error. This can be ignored in our test tearDown.
-        try:
-            self.cam._close()
-        except Exception:
-            pass
-        self.vmb._shutdown()
+        # The camera is shared by all tests of the class. Make sure a failed test does not leave a
+        # stream running for the following tests. Streams of a closed camera are not streaming
+        for stream in self.streams:
+            if stream.is_streaming():
+                stream.stop_streaming()
 
     def test_stream_feature_discovery(self):
         # Expectation: Outside of context, all features must be cleared,
         # inside of context all features must be detected.
         for stream in self.streams:
             with self.subTest(f'stream={stream}'):
-                self.assertNotEqual(stream.get_all_features(), ())
+                self.assertTrue(self.stream_features[stream])
 
     def test_stream_features_category(self):
         # Expectation: Getting features by category for an existing category returns a set of
         # features, for a non-existent category an empty set is returned
         for stream in self.streams:
             with self.subTest(f'stream={stream}'):
-                category = stream.get_all_features()[0].get_category()
-                self.assertNotEqual(stream.get_features_by_category(category), ())
+                category = self.stream_features[stream][0].get_category()
+                by_category = self.stream_features_by_category[stream]
+                self.assertTrue(by_category[category])
+                self.assertEqual(stream.get_features_by_category(category),
+                                 tuple(by_category[category]))
                 self.assertEqual(stream.get_features_by_category("Invalid Category"), ())
 
     def test_stream_feature_by_name(self):
@@ -89,67 +121,69 @@ class StreamTest(VmbPyTestCase):
         # VmbFeatureError
         for stream in self.streams:
             with self.subTest(f'stream={stream}'):
-                feat = stream.get_all_features()[0]
-                self.assertEqual(stream.get_feature_by_name(feat.get_name()), feat)
+                feat = self.stream_features[stream][0]
+                self.assertIs(stream.get_feature_by_name(feat.get_name()), feat)
                 self.assertRaises(VmbFeatureError, stream.get_feature_by_name, "Invalid Name")
 
     def test_stream_features_by_type(self):
         # Expectation: Getting features by type returns a set of features for an existing type
         for stream in self.streams:
             with self.subTest(f'stream={stream}'):
-                type = stream.get_all_features()[0].get_type()
-                self.assertNotEqual(stream.get_features_by_type(type), ())
+                type = self.stream_features[stream][0].get_type()
+                by_type = self.stream_features_by_type[stream]
+                self.assertTrue(by_type[type])
+                self.assertEqual(stream.get_features_by_type(type), tuple(by_type[type]))
 
     def test_stream_features_selected_by(self):
         # Expectation: Selected features can be gotten for a feature instance
         for stream in self.streams:
             with self.subTest(f'stream={stream}'):
-                try:
-                    feat = [f for f in stream.get_all_features()
-                            if f.has_selected_features()].pop()
-                except IndexError:
+                feat = next((f for f in self.stream_features[stream] if f.has_selected_features()),
+                            None)
+                if feat is None:
                     self.skipTest('Could not find feature with \'selected features\'')
-                self.assertNotEqual(stream.get_features_selected_by(feat), ())
+                self.assertTrue(stream.get_features_selected_by(feat))
 
     def test_stream_frame_generator_limit_set(self):
         # Expectation: The Frame generator fetches the given number of images.
-        for stream in self.cam.get_streams():
-            with self.subTest(f'Stream={stream}'):
-                for expected_frames in (1, 7, 11):
-                    count = 0
-                    for _ in self.cam.get_frame_generator(expected_frames):
-                        count += 1
-                    self.assertEqual(count, expected_frames)
+        for expected_frames in (1, 7, 11):
+            with self.subTest(f'limit={expected_frames}'):
+                count = sum(1 for _ in self.cam.get_frame_generator(expected_frames))
+                self.assertEqual(count, expected_frames)
 
     def test_stream_frame_generator_error(self):
         # Expectation: The Frame generator raises a ValueError on a negative limit
 
-        for stream in self.cam.get_streams():
-            with self.subTest(f'Stream={stream}'):
-                # Check limits
-                for limits in ((0, ), (-1, ), (1, 0), (1, -1)):
-                    with self.assertRaises(ValueError):
-                        for _ in self.cam.get_frame_generator(*limits):
-                            pass
+        # Check limits. Invalid limits are rejected before any streaming state changes
+        for limits in ((0, ), (-1, ), (1, 0), (1, -1)):
+            with self.subTest(f'limits={limits}'):
+                with self.assertRaises(ValueError):
+                    list(self.cam.get_frame_generator(*limits))
 
-                # generator execution must throw if streaming is enabled
-                self.cam.start_streaming(dummy_frame_handler, 5)
+        # generator execution must throw if streaming is enabled. Streaming is a camera level
+        # operation, so it is started once for the checks of all streams
+        self.cam.start_streaming(dummy_frame_handler, 5)
 
+        for stream in self.streams:
+            with self.subTest(f'Stream={stream}'):
                 self.assertRaises(VmbCameraError, stream.get_frame)
                 with self.assertRaises(VmbCameraError):
                     for _ in stream.get_frame_generator(1):
                         pass
 
-                # Stop Streaming: Everything should be fine.
-                self.cam.stop_streaming()
+        # Stop Streaming: Everything should be fine.
+        self.cam.stop_streaming()
+        for stream in self.streams:
+            with self.subTest(f'Stream={stream}'):
                 self.assertNoRaise(stream.get_frame)
-                for f in self.cam.get_frame_generator(1):
-                    self.assertIsInstance(f, Frame)
+
+        for f in self.cam.get_frame_generator(1):
+            self.assertIsInstance(f, Frame)
 
     def test_stream_get_frame(self):
         # Expectation: Gets single Frame without any exception. Image data must be set.
         # If a zero or negative timeouts must lead to a ValueError.
-        for stream in self.cam.get_streams():
+        for stream in self.streams:
             with self.subTest(f'Stream={stream}'):
                 self.assertRaises(ValueError, stream.get_frame, 0)
                 self.assertRaises(ValueError, stream.get_frame, -1)
@@ -159,14 +193,14 @@ class StreamTest(VmbPyTestCase):
 
     def test_camera_get_frame_with_context(self):
         # Expectation: Gets a single context managed Frame.
-        for stream in self.cam.get_streams():
+        for stream in self.streams:
             with self.subTest(f'Stream={stream}'):
                 with stream.get_frame_with_context() as frame:
                     self.assertIsInstance(frame, Frame)
 
     def test_camera_get_frame_with_context_invalid_timeouts_raise_error(self):
         # Expectation: Using an invalid value for the timeout parameter raises a `ValueError`.
-        for stream in self.cam.get_streams():
+        for stream in self.streams:
             with self.subTest(f'Stream={stream}'):
                 for invalid_value in (0, -1):
                     with self.subTest(f'timeout_ms={invalid_value}'):
@@ -179,43 +213,52 @@ class StreamTest(VmbPyTestCase):
         # return false. If the camera context is left without stop_streaming(), leaving
         # the context must stop all streams.
 
-        # self.cam was already entered in the setUp method. Exit here for clean context manager
+        # self.cam was already entered in the setUpClass method. Exit here for clean context manager
         # state so that leaving the context closes the Camera as expected
         # self.cam._close()
 
+        class FirstFrameHandler:
+            def __init__(self):
+                self.first_frame = threading.Event()
+
+            def __call__(self, cam: Camera, stream: Stream, frame: Frame):
+                self.first_frame.set()
+
         # Normal Operation
-        for stream in self.cam.get_streams():
+        for stream in self.streams:
             with self.subTest(f'Stream={stream}'):
-                self.cam.start_streaming(dummy_frame_handler)
+                handler = FirstFrameHandler()
+                self.cam.start_streaming(handler)
                 self.assertEqual(stream.is_streaming(), True)
-                # Wait a little bit before stopping the stream again to give camera time to settle
-                time.sleep(0.1)
+                # Give camera time to settle before stopping the stream again. Waiting ends early
+                # once the first frame has arrived, but never takes longer than the 0.1 s sleep
+                # this replaces. Only settling is needed here, so a timeout is not an error
+                handler.first_frame.wait(0.1)
 
                 self.cam.stop_streaming()
                 self.assertEqual(stream.is_streaming(), False)
 
         # Missing the stream stop. Close must stop all active streams
         streams = []
-        for stream in self.cam.get_streams():
+        for stream in self.streams:
             streams.append(stream)
             stream.start_streaming(dummy_frame_handler, 5)
             self.assertEqual(stream.is_streaming(), True)
 
-        # Closing camera connection must stop all active streams
+        # Closing camera connection must stop all active streams. The camera is reopened by setUp of
+        # the next test
         self.cam._close()
+        type(self).cam_open = False
 
         for stream in streams:
-            # This is actually not how users should use the Stream class. Camera is closed and the
-            # Stream class is useless without an open Camera connection!
+            # This is actually not how users should use the Stream class. Camera is closed and
+            # the Stream class is useless without an open Camera connection!
             self.assertEqual(stream.is_streaming(), False)
 
-        # Open camera again so tests tearDown method works correctly
-        self.cam._open()
-
     def test_stream_streaming_error_frame_count(self):
         # Expectation: A negative or zero frame_count must lead to an value error
         # with self.cam:
-        for stream in self.cam.get_streams():
+        for stream in self.streams:
             with self.subTest(f'Stream={stream}'):
                 self.assertRaises(ValueError, stream.start_streaming, dummy_frame_handler, 0)
                 self.assertRaises(ValueError, stream.start_streaming, dummy_frame_handler, -1)
@@ -238,23 +281,23 @@ class StreamTest(VmbPyTestCase):
         frame_count = 10
         handler = FrameHandler(frame_count)
 
-        for stream in self.cam.get_streams():
-            with self.subTest(f'Stream={stream}'):
-                try:
-                    timeout = calculate_acquisition_time(self.cam, frame_count)
-                    # Add one second extra time for acquisition overhead and additional 10% buffer
-                    timeout = 1.1 * (1.0 + timeout)
-                except VmbFeatureError:
-                    timeout = 5.0
-                try:
-                    self.cam.start_streaming(handler, frame_count)
+        # The acquisition time only depends on the camera configuration
+        try:
+            timeout = calculate_acquisition_time(self.cam, frame_count)
+            # Add one second extra time for acquisition overhead and additional 10% buffer
+            timeout = 1.1 * (1.0 + timeout)
+        except VmbFeatureError:
+            timeout = 5.0
 
-                    # Wait until the FrameHandler has been executed for each queued frame
-                    self.assertTrue(handler.event.wait(timeout),
-                                    'Handler event was not set. Frame count was not reached')
+        try:
+            self.cam.start_streaming(handler, frame_count)
 
-                finally:
-                    self.cam.stop_streaming()
+            # Wait until the FrameHandler has been executed for each queued frame
+            self.assertTrue(handler.event.wait(timeout),
+                            'Handler event was not set. Frame count was not reached')
+
+        finally:
+            self.cam.stop_streaming()
 
     def test_stream_streaming_requeue(self):
         # Expectation: A given frame must be reused if it is enqueued again.
@@ -265,6 +308,10 @@ class StreamTest(VmbPyTestCase):
                 self.frame_count = frame_count
                 self.event = threading.Event()
 
+            def reset(self):
+                self.cnt = 0
+                self.event.clear()
+
             def __call__(self, cam: Camera, stream: Stream, frame: Frame):
                 self.cnt += 1
 
@@ -277,14 +324,18 @@ class StreamTest(VmbPyTestCase):
         frame_reuse = 2
         handler = FrameHandler(frame_count * frame_reuse)
 
-        for stream in self.cam.get_streams():
+        # The acquisition time only depends on the camera configuration
+        try:
+            timeout = calculate_acquisition_time(self.cam, frame_count * frame_reuse)
+            # Add one second extra time for acquisition overhead and additional 10% buffer
+            timeout = 1.1 * (1.0 + timeout)
+        except VmbFeatureError:
+            timeout = 5.0
+
+        for stream in self.streams:
             with self.subTest(f'Stream={stream}'):
-                try:
-                    timeout = calculate_acquisition_time(self.cam, frame_count * frame_reuse)
-                    # Add one second extra time for acquisition overhead and additional 10% buffer
-                    timeout = 1.1 * (1.0 + timeout)
-                except VmbFeatureError:
-                    timeout = 5.0
+                # Handler is shared by all streams. Start counting from zero for each of them
+                handler.reset()
                 try:
                     stream.start_streaming(handler, frame_count)
 
@@ -298,43 +349,28 @@ class StreamTest(VmbPyTestCase):
     def test_stream_context_sensitivity(self):
         # Expectation: Call get_all_features outside of Camera context raises a RuntimeError and
         # the error message references the Camera context
-        stream = self.cam.get_streams()[0]
-        feat = stream.get_all_features()[0]
+        stream = self.streams[0]
+        feat = self.stream_features[stream][0]
         feat_name = feat.get_name()
 
+        outside_context = re.compile('outside of Camera.* context')
+        calls = ((stream.get_all_features, ()),
+                 (stream.get_features_selected_by, (feat,)),
+                 (stream.get_features_by_type, (IntFeature,)),
+                 (stream.get_features_by_category, ('foo',)),
+                 (stream.get_feature_by_name, (feat_name,)))
+
         # Ensure that normal calls work while context is still open
-        self.assertNoRaise(stream.get_all_features)
-        self.assertNoRaise(stream.get_features_selected_by, feat)
-        self.assertNoRaise(stream.get_features_by_type, IntFeature)
-        self.assertNoRaise(stream.get_features_by_category, 'foo')
-        self.assertNoRaise(stream.get_feature_by_name, feat_name)
+        for func, args in calls:
+            with self.subTest(f'{func.__name__} inside context'):
+                self.assertNoRaise(func, *args)
 
         # This closes the stream[0] of self.cam implicitly. Alternatively it is possible to call
-        # stream.close() here if that implicit behavior should not be relied upon
+        # stream.close() here if that implicit behavior should not be relied upon. The camera is
+        # reopened by setUp of the next test
         self.cam._close()
-        self.assertRaisesRegex(RuntimeError,
-                               'outside of Camera.* context',
-                               stream.get_all_features)
-
-        self.assertRaisesRegex(RuntimeError,
-                               'outside of Camera.* context',
-                               stream.get_features_selected_by,
-                               feat)
-
-        self.assertRaisesRegex(RuntimeError,
-                               'outside of Camera.* context',
-                               stream.get_features_by_type,
-                               IntFeature)
-
-        self.assertRaisesRegex(RuntimeError,
-                               'outside of Camera.* context',
-                               stream.get_features_by_category,
-                               'foo')
-
-        self.assertRaisesRegex(RuntimeError,
-                               'outside of Camera.* context',
-                               stream.get_feature_by_name,
-                               feat_name)
-
-        # open camera context again so tearDown works as expected
-        self.cam._open()
+        type(self).cam_open = False
+
+        for func, args in calls:
+            with self.subTest(f'{func.__name__} outside context'):
+                self.assertRaisesRegex(RuntimeError, outside_context, func, *args)
@@ -37,63 +37,71 @@ from helpers import VmbPyTestCase
 
 
 class CamVimbaTest(VmbPyTestCase):
-    def setUp(self):
-        self.vmb = VmbSystem.get_instance()
-
-    def tearDown(self):
-        pass
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Starting VmbSystem detects all transport layers, interfaces and cameras. Do it once for
+        # the whole class. Tests may still enter the context, which only increases its reference
+        # count
+        cls.vmb = VmbSystem.get_instance()
+        cls.vmb.__enter__()
+
+        # Interface ids stay the same even if the context is left and entered again
+        cls.interface_ids = tuple(inter.get_id() for inter in cls.vmb.get_all_interfaces())
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.vmb.__exit__(None, None, None)
+        super().tearDownClass()
 
     def test_context_entry_exit(self):
         # Expected Behavior:
         # On entering the context features, cameras and interfaces shall
         # be detected and after leaving the context, everything should be reverted.
 
-        self.assertRaises(RuntimeError, self.vmb.get_all_features)
-        self.assertRaises(RuntimeError, self.vmb.get_all_interfaces)
-        self.assertRaises(RuntimeError, self.vmb.get_all_cameras)
+        # The class keeps the context entered for all other tests. Leave it here to check the
+        # behavior outside of the context and enter it again afterwards
+        self.vmb.__exit__(None, None, None)
+        try:
+            self.assertRaises(RuntimeError, self.vmb.get_all_features)
+            self.assertRaises(RuntimeError, self.vmb.get_all_interfaces)
+            self.assertRaises(RuntimeError, self.vmb.get_all_cameras)
 
-        with self.vmb:
-            self.assertNotEqual(self.vmb.get_all_features(), ())
-            self.assertNotEqual(self.vmb.get_all_interfaces(), ())
-            self.assertNotEqual(self.vmb.get_all_cameras(), ())
+            with self.vmb:
+                self.assertTrue(self.vmb.get_all_features())
+                self.assertTrue(self.vmb.get_all_interfaces())
+                self.assertTrue(self.vmb.get_all_cameras())
 
-        self.assertRaises(RuntimeError, self.vmb.get_all_features)
-        self.assertRaises(RuntimeError, self.vmb.get_all_interfaces)
-        self.assertRaises(RuntimeError, self.vmb.get_all_cameras)
+            self.assertRaises(RuntimeError, self.vmb.get_all_features)
+            self.assertRaises(RuntimeError, self.vmb.get_all_interfaces)
+            self.assertRaises(RuntimeError, self.vmb.get_all_cameras)
+            for id_ in self.interface_ids:
+                self.assertRaises(RuntimeError, self.vmb.get_interface_by_id, id_)
 
-    def test_get_all_interfaces(self):
-        # Expected Behavior: get_all_interfaces() must raise an RuntimeError in closed state and
-        # be non-empty then opened.
-        self.assertRaises(RuntimeError, self.vmb.get_all_interfaces)
+        finally:
+            self.vmb.__enter__()
 
-        with self.vmb:
-            self.assertTrue(self.vmb.get_all_interfaces())
+    def test_get_all_interfaces(self):
+        # Expected Behavior: get_all_interfaces() must be non-empty then opened. Raising a
+        # RuntimeError in closed state is checked in test_context_entry_exit.
+        self.assertTrue(self.vmb.get_all_interfaces())
 
     def test_get_interface_by_id(self):
-        # Expected Behavior: All detected Interfaces must be lookup able by their Id.
-        # If outside of given scope, an error must be returned
-        with self.vmb:
-            ids = [inter.get_id() for inter in self.vmb.get_all_interfaces()]
-
-            for id_ in ids:
-                self.assertNoRaise(self.vmb.get_interface_by_id, id_)
-
-        for id_ in ids:
-            self.assertRaises(RuntimeError, self.vmb.get_interface_by_id, id_)
+        # Expected Behavior: All detected Interfaces must be lookup able by their Id. Raising a
+        # RuntimeError outside of given scope is checked in test_context_entry_exit.
+        for id_ in self.interface_ids:
+            self.assertNoRaise(self.vmb.get_interface_by_id, id_)
 
     def test_get_all_cameras(self):
         # Expected Behavior: get_all_cameras() must only return camera handles on a open camera.
-        self.assertRaises(RuntimeError, self.vmb.get_all_cameras)
-
-        with self.vmb:
-            self.assertTrue(self.vmb.get_all_cameras())
+        # Raising a RuntimeError in closed state is checked in test_context_entry_exit.
+        self.assertTrue(self.vmb.get_all_cameras())
 
     def test_get_camera_by_id(self):
         # Expected Behavior: Lookup of test camera must not fail after system opening
         camera_id = self.get_test_camera_id()
 
-        with self.vmb:
-            self.assertNoRaise(self.vmb.get_camera_by_id, camera_id)
+        self.assertNoRaise(self.vmb.get_camera_by_id, camera_id)
 
     @unittest.skipIf(VmbPyTestCase.get_test_camera_id().startswith("Sim"),
                      "Test skipped in simulation mode.")
@@ -102,55 +110,54 @@ class CamVimbaTest(VmbPyTestCase):
         # A with lookup of an invalid ipv4 address (no Camera attached)
         # must raise a VmbCameraError, a lookup with an ipv6 address must raise a
         # VmbCameraError in general (VmbC doesn't support ipv6)
-        with self.vmb:
-            # Verify that the Test Camera is a GigE - Camera
-            cam = self.vmb.get_camera_by_id(self.get_test_camera_id())
-            inter = self.vmb.get_interface_by_id(cam.get_interface_id())
 
-            if inter.get_type() != TransportLayerType.GEV:
-                raise self.skipTest('Test requires GEV Camera.')
+        # Verify that the Test Camera is a GigE - Camera
+        cam = self.vmb.get_camera_by_id(self.get_test_camera_id())
+        inter = self.vmb.get_interface_by_id(cam.get_interface_id())
 
-            # Lookup test cameras IP address.
-            with cam:
-                local_device = cam.get_local_device()
-                ip_as_number = local_device.get_feature_by_name('GevDeviceIPAddress').get()
+        if inter.get_type() != TransportLayerType.GEV:
+            raise self.skipTest('Test requires GEV Camera.')
 
-            # Verify that lookup with IPv4 Address returns the same Camera Object
-            ip_addr = str(ipaddress.IPv4Address(ip_as_number))
-            self.assertEqual(self.vmb.get_camera_by_id(ip_addr), cam)
+        # Lookup test cameras IP address.
+        with cam:
+            local_device = cam.get_local_device()
+            ip_as_number = local_device.get_feature_by_name('GevDeviceIPAddress').get()
 
-            # Verify that a lookup with an invalid IPv4 Address raises a VmbCameraError
-            ip_addr = str(ipaddress.IPv4Address('127.0.0.1'))
-            self.assertRaises(VmbCameraError, self.vmb.get_camera_by_id, ip_addr)
+        # Verify that lookup with IPv4 Address returns the same Camera Object
+        ip_addr = str(ipaddress.IPv4Address(ip_as_number))
+        self.assertEqual(self.vmb.get_camera_by_id(ip_addr), cam)
 
-            # Verify that a lookup with an IPv6 Address raises a VmbCameraError
-            ip_addr = str(ipaddress.IPv6Address('FD00::DEAD:BEEF'))
-            self.assertRaises(VmbCameraError, self.vmb.get_camera_by_id, ip_addr)
+        # Verify that a lookup with an invalid IPv4 Address raises a VmbCameraError
+        ip_addr = str(ipaddress.IPv4Address('127.0.0.1'))
+        self.assertRaises(VmbCameraError, self.vmb.get_camera_by_id, ip_addr)
+
+        # Verify that a lookup with an IPv6 Address raises a VmbCameraError
+        ip_addr = str(ipaddress.IPv6Address('FD00::DEAD:BEEF'))
+        self.assertRaises(VmbCameraError, self.vmb.get_camera_by_id, ip_addr)
 
     @unittest.skipIf(VmbPyTestCase.get_test_camera_id().startswith("Sim"),
                      "Test skipped in simulation mode.")
     def test_get_camera_by_mac(self):
         # Expected Behavior: get_feature_by_id must be usable with a given MAC Address.
-        with self.vmb:
-            # Verify that the Test Camera is a GigE - Camera
-            cam = self.vmb.get_camera_by_id(self.get_test_camera_id())
-            inter = self.vmb.get_interface_by_id(cam.get_interface_id())
 
-            if inter.get_type() != TransportLayerType.GEV:
-                raise self.skipTest('Test requires GEV Camera.')
+        # Verify that the Test Camera is a GigE - Camera
+        cam = self.vmb.get_camera_by_id(self.get_test_camera_id())
+        inter = self.vmb.get_interface_by_id(cam.get_interface_id())
+
+        if inter.get_type() != TransportLayerType.GEV:
+            raise self.skipTest('Test requires GEV Camera.')
 
-            # Lookup test cameras MAC Address.
-            with cam:
-                # Construct MAC Address from raw value.
-                local_device = cam.get_local_device()
-                mac_as_number = local_device.get_feature_by_name('GevDeviceMACAddress').get()
+        # Lookup test cameras MAC Address.
+        with cam:
+            # Construct MAC Address from raw value.
+            local_device = cam.get_local_device()
+            mac_as_number = local_device.get_feature_by_name('GevDeviceMACAddress').get()
 
-            mac_as_bytes = mac_as_number.to_bytes(6, byteorder='big')
-            mac_as_str = ''.join(format(s, '02x') for s in mac_as_bytes).upper()
+        mac_as_str = mac_as_number.to_bytes(6, byteorder='big').hex().upper()
 
-            # Verify that lookup with MAC Address returns the same Camera Object
-            self.assertEqual(self.vmb.get_camera_by_id(mac_as_str), cam)
+        # Verify that lookup with MAC Address returns the same Camera Object
+        self.assertEqual(self.vmb.get_camera_by_id(mac_as_str), cam)
 
-            # Verify that a lookup with an invalid MAC Address raises a VmbCameraError
-            invalid_mac = 'ffffffff'
-            self.assertRaises(VmbCameraError, self.vmb.get_camera_by_id, invalid_mac)
+        # Verify that a lookup with an invalid MAC Address raises a VmbCameraError
+        invalid_mac = 'ffffffff'
+        self.assertRaises(VmbCameraError, self.vmb.get_camera_by_id, invalid_mac)
@@ -25,6 +25,7 @@ OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 import argparse
+import importlib
 import os
 import sys
 import unittest
@@ -52,6 +53,9 @@ class Parser(argparse.ArgumentParser):
                           help='Camera Id used while testing. If no ID is specified, the first '
                                'device that is found is used',
                           metavar='camera_id')
+        self.add_argument('-f', '--failfast',
+                          help='Stop the test run on the first error or failure',
+                          action='store_true')
         self.add_argument('blacklist',
                           help='Optional sequence of unittest functions to skip',
                           nargs='*')
@@ -65,7 +69,14 @@ class Parser(argparse.ArgumentParser):
                                   metavar='report_dir')
 
 
+_BLACKLIST_SKIP = unittest.skip('Blacklisted')
+
+
 def _blacklist_tests(test_suite, blacklist):
+    # Nothing to do for the common case of an empty blacklist
+    if not blacklist:
+        return test_suite
+
     for test in test_suite:
         # Process TestSuites recursively
         if isinstance(test, unittest.TestSuite):
@@ -76,12 +87,12 @@ def _blacklist_tests(test_suite, blacklist):
         else:
             name = test._testMethodName
             if name in blacklist:
-                setattr(test, name, unittest.skip('Blacklisted')(getattr(test, name)))
+                setattr(test, name, _BLACKLIST_SKIP(getattr(test, name)))
 
     return test_suite
 
 
-def print_test_execution_info():
+def print_test_execution_info(suite='all'):
     import vmbpy
     import platform
     import socket
@@ -96,9 +107,10 @@ def print_test_execution_info():
     def aligned_print(first, second):
         print(f'{first:<{alignment_width}}: {second}')
     aligned_print('API versions', vmbpy.VmbSystem.get_instance().get_version())
-    aligned_print('Hostname', platform.node())
+    hostname = platform.node()
+    aligned_print('Hostname', hostname)
     try:
-        aligned_print('IP Address:', socket.gethostbyname(socket.gethostname()))
+        aligned_print('IP Address:', socket.gethostbyname(hostname))
     except:  # noqa E722
         # resolving host name may fail. Do not print IP in that case
         pass
@@ -106,7 +118,8 @@ def print_test_execution_info():
     aligned_print('Architecture', platform.machine())
     camera_id = VmbPyTestCase.get_test_camera_id()
     aligned_print('Camera ID', camera_id)
-    if camera_id:
+    # The basic suite does not use a camera. Opening it just to print its details is not needed
+    if camera_id and suite != 'basic':
         with vmbpy.VmbSystem.get_instance() as vmb:
             try:
                 with vmb.get_camera_by_id(camera_id) as cam:
@@ -135,73 +148,55 @@ if __name__ == '__main__':
     if args.camera_id:
         VmbPyTestCase.set_test_camera_id(args.camera_id)
     VmbPyTestCase.setUpClass()
-    print_test_execution_info()
+    print_test_execution_info(args.suite)
 
     # Select TestRunner
     if args.console:
-        runner = unittest.TextTestRunner(verbosity=2)
+        runner = unittest.TextTestRunner(verbosity=2, failfast=args.failfast)
 
     elif args.junit_xml:
         import xmlrunner
-        runner = xmlrunner.XMLTestRunner(output=args.junit_xml)
-
-    # Import tests cases
-    import basic_tests.c_binding_test
-    import basic_tests.frame_test
-    import basic_tests.interface_test
-    import basic_tests.persistable_feature_container_test
-    import basic_tests.transport_layer_test
-    import basic_tests.util_context_decorator_test
-    import basic_tests.util_runtime_type_check_test
-    import basic_tests.util_tracer_test
-    import basic_tests.util_vmb_enum_test
-    import basic_tests.vimbax_common_test
-    import basic_tests.vmbsystem_test
-    import real_cam_tests.camera_test
-    import real_cam_tests.chunk_access_test
-    import real_cam_tests.feature_test
-    import real_cam_tests.frame_test
-    import real_cam_tests.local_device_test
-    import real_cam_tests.persistable_feature_container_test
-    import real_cam_tests.stream_test
-    import real_cam_tests.vimbax_test
+        runner = xmlrunner.XMLTestRunner(output=args.junit_xml, failfast=args.failfast)
 
     # Assign test cases to test suites
     BASIC_TEST_MODS = [
-        basic_tests.c_binding_test,
-        basic_tests.frame_test,
-        basic_tests.util_runtime_type_check_test,
-        basic_tests.util_tracer_test,
-        basic_tests.util_context_decorator_test,
-        basic_tests.util_vmb_enum_test,
-        basic_tests.vimbax_common_test,
-        basic_tests.vmbsystem_test,
-        basic_tests.interface_test,
-        basic_tests.transport_layer_test,
-        basic_tests.persistable_feature_container_test
+        'basic_tests.c_binding_test',
+        'basic_tests.frame_test',
+        'basic_tests.util_runtime_type_check_test',
+        'basic_tests.util_tracer_test',
+        'basic_tests.util_context_decorator_test',
+        'basic_tests.util_vmb_enum_test',
+        'basic_tests.vimbax_common_test',
+        'basic_tests.vmbsystem_test',
+        'basic_tests.interface_test',
+        'basic_tests.transport_layer_test',
+        'basic_tests.persistable_feature_container_test'
     ]
 
     REAL_CAM_TEST_MODS = [
-        real_cam_tests.vimbax_test,
-        real_cam_tests.feature_test,
-        real_cam_tests.camera_test,
-        real_cam_tests.frame_test,
-        real_cam_tests.local_device_test,
-        real_cam_tests.chunk_access_test,
-        real_cam_tests.persistable_feature_container_test,
-        real_cam_tests.stream_test,
-        real_cam_tests.vimbax_test
+        'real_cam_tests.vimbax_test',
+        'real_cam_tests.feature_test',
+        'real_cam_tests.camera_test',
+        'real_cam_tests.frame_test',
+        'real_cam_tests.local_device_test',
+        'real_cam_tests.chunk_access_test',
+        'real_cam_tests.persistable_feature_container_test',
+        'real_cam_tests.stream_test'
     ]
 
-    # Prepare TestSuite
-    test_suite = unittest.TestSuite()
+    # Prepare TestSuite. Test modules are only imported if their suite was selected
+    test_mods = []
     if args.suite in ('basic', 'all'):
-        for mod in BASIC_TEST_MODS:
-            test_suite.addTests(_blacklist_tests(loader.loadTestsFromModule(mod), args.blacklist))
+        test_mods.extend(BASIC_TEST_MODS)
 
     if args.suite in ('real_cam', 'all'):
-        for mod in REAL_CAM_TEST_MODS:
-            test_suite.addTests(_blacklist_tests(loader.loadTestsFromModule(mod), args.blacklist))
+        test_mods.extend(REAL_CAM_TEST_MODS)
+
+    blacklist = frozenset(args.blacklist)
+    test_suite = unittest.TestSuite()
+    for mod_name in test_mods:
+        mod = importlib.import_module(mod_name)
+        test_suite.addTests(_blacklist_tests(loader.loadTestsFromModule(mod), blacklist))
 
     reset_default_user_set(VmbPyTestCase.get_test_camera_id())
     load_default_user_set(VmbPyTestCase.get_test_camera_id())
@@ -24,9 +24,12 @@ CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
 OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
+import functools
+import glob
 import os
 import shutil
 import subprocess
+import sys
 
 from Tests.runner import Parser
 
@@ -35,121 +38,188 @@ def fprint(line):
     print(line, flush=True)
 
 
-def stringify_list(l):
-    list_str = ''
-    for e in l:
-        list_str += e + ' '
+def coverage_env(branch=False):
+    # Python 3.12 added sys.monitoring, which coverage can use instead of a trace function.
+    # This makes measured runs a lot faster. Older coverage versions ignore the variable. Branch
+    # measurement is not supported by sysmon on all Python versions. Coverage would then warn and
+    # fall back to its C tracer anyway, so sysmon is only requested for line coverage.
+    env = os.environ.copy()
+    if sys.version_info >= (3, 12) and not branch:
+        env.setdefault('COVERAGE_CORE', 'sysmon')
 
-    return list_str
+    return env
+
+
+@functools.lru_cache(maxsize=None)
+def tool(name):
+    # Resolve the executable once, and fail with a helpful message if it is not installed
+    path = shutil.which(name)
+    if path is None:
+        sys.exit('Required tool \'{}\' was not found. Install the \'test\' extra of vmbpy to '
+                 'run the complete test suite.'.format(name))
+
+    return path
+
+
+def load_coverage():
+    # The tests are measured in a separate 'coverage run' process so that vmbpy is imported
+    # under measurement. Reports are generated from the collected data in this process to avoid
+    # starting another interpreter for each report.
+    import coverage
+
+    cov = coverage.Coverage()
+    cov.load()
+    return cov
+
+
+def run_concurrently(*cmds):
+    # Start all commands at once and collect their results in the given order. The output of
+    # each command is captured so that it is not interleaved with the output of the others.
+    procs = [subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                              universal_newlines=True) for cmd in cmds]
+    results = []
+    for cmd, proc in zip(cmds, procs):
+        output, _ = proc.communicate()
+        results.append(subprocess.CompletedProcess(cmd, proc.returncode, output))
+
+    return results
 
 
 def static_test():
+    flake8_result, mypy_result = run_concurrently(
+        [tool('flake8'), 'vmbpy', 'Examples', 'Tests'],
+        [tool('mypy'), 'vmbpy']
+    )
+
     fprint('Execute Static Test: flake8')
-    subprocess.run('flake8 vmbpy', shell=True)
-    subprocess.run('flake8 Examples --ignore=F405,F403', shell=True)
-    subprocess.run('flake8 Tests --ignore=F405,F403,E402', shell=True)
+    print(flake8_result.stdout, end='')
     fprint('')
 
     fprint('Execute Static Test: mypy')
-    subprocess.run('mypy vmbpy', shell=True, check=True)
+    print(mypy_result.stdout, end='')
     fprint('')
+    mypy_result.check_returncode()
 
 
-def unit_test(testsuite, testcamera, blacklist):
-    blacklist = " ".join(blacklist)
-
-    fprint('Execute Unit tests and measure coverage:')
-    if testsuite == 'basic':
-        cmd = 'coverage run Tests/runner.py -s basic --console {}'.format(blacklist)
+def unit_test(testsuite, testcamera, blacklist, failfast=False, measure_coverage=True):
+    if measure_coverage:
+        fprint('Execute Unit tests and measure coverage:')
+        cmd = [tool('coverage'), 'run']
 
     else:
-        cmd = 'coverage run Tests/runner.py -s {} --console {}'
-        cmd = cmd.format(testsuite, blacklist)
-        if testcamera:
-            cmd += ' -c {}'.format(testcamera)
+        fprint('Execute Unit tests:')
+        cmd = [sys.executable]
+
+    cmd += ['Tests/runner.py', '-s', testsuite, '--console', *blacklist]
+    if testsuite != 'basic' and testcamera:
+        cmd += ['-c', testcamera]
+
+    if failfast:
+        cmd.append('--failfast')
 
-    subprocess.run(cmd, shell=True, check=True)
+    subprocess.run(cmd, check=True, env=coverage_env() if measure_coverage else None)
     fprint('')
 
+    if not measure_coverage:
+        return
+
     fprint('Coverage during test execution:')
-    subprocess.run('coverage report -m', shell=True, check=True)
+    cov = load_coverage()
+    cov.report(show_missing=True)
     fprint('')
 
-    coverage_file = '.coverage'
-    if os.path.exists(coverage_file):
-        os.remove(coverage_file)
+    cov.erase()
 
 
 def setup_junit(report_dir):
-    if os.path.exists(report_dir):
-        shutil.rmtree(report_dir, ignore_errors=True)
+    os.makedirs(report_dir, exist_ok=True)
+
+    # Reuse an existing report directory. Only remove reports written by a previous run so that
+    # no outdated results are picked up
+    reports = [os.path.join(report_dir, report)
+               for report in ('flake8.txt', 'flake8_junit.xml', 'mypy_junit.xml', 'coverage.xml')]
+    reports += glob.glob(os.path.join(report_dir, 'TEST-*.xml'))
+    for report in reports:
+        try:
+            os.remove(report)
 
-    os.mkdir(report_dir)
+        except FileNotFoundError:
+            pass
 
 
 def static_test_junit(report_dir):
-    fprint('Execute Static Test: flake8')
-    cmd = 'flake8 vmbpy --output-file=' + report_dir + '/flake8.txt'
-    subprocess.run(cmd, shell=True, check=True)
+    flake8_report = os.path.join(report_dir, 'flake8.txt')
+    flake8_result, mypy_result = run_concurrently(
+        [tool('flake8'), 'vmbpy', '--output-file=' + flake8_report],
+        [tool('mypy'), 'vmbpy', '--junit-xml', os.path.join(report_dir, 'mypy_junit.xml')]
+    )
 
-    cmd = 'flake8_junit ' + report_dir + '/flake8.txt ' + report_dir + '/flake8_junit.xml'
-    subprocess.run(cmd, shell=True, check=True)
+    fprint('Execute Static Test: flake8')
+    print(flake8_result.stdout, end='')
     fprint('')
 
     fprint('Execute Static Test: mypy')
-    cmd = 'mypy vmbpy --junit-xml ' + report_dir + '/mypy_junit.xml'
-    subprocess.run(cmd, shell=True, check=True)
+    print(mypy_result.stdout, end='')
     fprint('')
 
+    # Only fail after both tools ran, so that a flake8 failure does not hide mypy results
+    flake8_result.check_returncode()
+    mypy_result.check_returncode()
+
+    cmd = [tool('flake8_junit'), flake8_report, os.path.join(report_dir, 'flake8_junit.xml')]
+    subprocess.run(cmd, check=True)
 
-def unit_test_junit(report_dir, testsuite, testcamera, blacklist):
+
+def unit_test_junit(report_dir, testsuite, testcamera, blacklist, failfast=False):
     fprint('Execute Unit tests and measure coverage:')
 
-    blacklist = " ".join(blacklist)
-    if testsuite == 'basic':
-        cmd = 'coverage run --branch Tests/runner.py -s basic --junit_xml {} {}'
-        cmd = cmd.format(report_dir, blacklist)
+    cmd = [tool('coverage'), 'run', '--branch', 'Tests/runner.py', '-s', testsuite,
+           '--junit_xml', report_dir]
+    if testsuite != 'basic' and testcamera:
+        cmd += ['-c', testcamera]
 
-    else:
-        cmd = 'coverage run --branch Tests/runner.py -s {} --junit_xml {}'
-        cmd = cmd.format(testsuite, report_dir,)
-        if testcamera:
-            cmd += ' -c {}'.format(testcamera)
-        cmd += ' {}'.format(blacklist)
+    cmd += blacklist
+    if failfast:
+        cmd.append('--failfast')
 
-    subprocess.run(cmd, shell=True, check=True)
+    subprocess.run(cmd, check=True, env=coverage_env(branch=True))
     fprint('')
 
     fprint('Generate Coverage reports:')
-    subprocess.run('coverage report -m', shell=True, check=True)
-    subprocess.run('coverage xml -o ' + report_dir + '/coverage.xml', shell=True, check=True)
+    cov = load_coverage()
+    cov.report(show_missing=True)
+    cov.xml_report(outfile=os.path.join(report_dir, 'coverage.xml'))
     fprint('')
 
-    coverage_file = '.coverage'
-    if os.path.exists(coverage_file):
-        os.remove(coverage_file)
+    cov.erase()
 
 
-def test(testsuite, testcamera, blacklist):
+def test(testsuite, testcamera, blacklist, failfast=False, measure_coverage=True):
     static_test()
-    unit_test(testsuite, testcamera, blacklist)
+    unit_test(testsuite, testcamera, blacklist, failfast, measure_coverage)
 
 
-def test_junit(report_dir, testsuite, testcamera, blacklist):
+def test_junit(report_dir, testsuite, testcamera, blacklist, failfast=False):
     setup_junit(report_dir)
     static_test_junit(report_dir)
-    unit_test_junit(report_dir, testsuite, testcamera, blacklist)
+    unit_test_junit(report_dir, testsuite, testcamera, blacklist, failfast)
 
 
 def main():
     arg_parser = Parser()
+    arg_parser.add_argument('--no_coverage',
+                            help='Do not measure coverage of console test runs. Junit runs always '
+                                 'measure coverage',
+                            action='store_true')
     args = arg_parser.parse_args()
 
     if args.console:
-        test(args.suite, args.camera_id, args.blacklist)
+        test(args.suite, args.camera_id, args.blacklist, args.failfast,
+             measure_coverage=not args.no_coverage)
 
     elif args.junit_xml:
-        test_junit(args.junit_xml, args.suite, args.camera_id, args.blacklist)
+        test_junit(args.junit_xml, args.suite, args.camera_id, args.blacklist,
+                   args.failfast)
 
 
 if __name__ == '__main__':
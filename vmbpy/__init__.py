@@ -116,21 +116,12 @@ __all__ = [
     'VmbFlagEnum'
 ]
 
-from .camera import AccessMode, Camera, CameraChangeHandler, CameraEvent
+import importlib
+from typing import TYPE_CHECKING
+
+# Modules without a dependency on VmbC are imported right away
 from .error import (VmbCameraError, VmbChunkError, VmbFeatureError, VmbFrameError,
                     VmbInterfaceError, VmbSystemError, VmbTimeout, VmbTransportLayerError)
-from .feature import (BoolFeature, CommandFeature, EnumEntry, EnumFeature, FeatureTypes,
-                      FeatureVisibility, FloatFeature, IntFeature, RawFeature, StringFeature)
-from .featurecontainer import (FeatureContainer, ModulePersistFlags, PersistableFeatureContainer,
-                               PersistType)
-from .frame import (BAYER_PIXEL_FORMATS, BGR_PIXEL_FORMATS, BGRA_PIXEL_FORMATS, COLOR_PIXEL_FORMATS,
-                    MONO_PIXEL_FORMATS, OPENCV_PIXEL_FORMATS, RGB_PIXEL_FORMATS, RGBA_PIXEL_FORMATS,
-                    YCBCR_PIXEL_FORMATS, YUV_PIXEL_FORMATS, AllocationMode, Debayer, Frame,
-                    FrameStatus, PayloadType, PixelFormat, intersect_pixel_formats)
-from .interface import Interface, InterfaceChangeHandler, InterfaceEvent
-from .localdevice import LocalDevice
-from .stream import FrameHandler, Stream
-from .transportlayer import TransportLayer, TransportLayerType
 from .util import (LOG_CONFIG_CRITICAL, LOG_CONFIG_CRITICAL_CONSOLE_ONLY,
                    LOG_CONFIG_CRITICAL_FILE_ONLY, LOG_CONFIG_DEBUG, LOG_CONFIG_DEBUG_CONSOLE_ONLY,
                    LOG_CONFIG_DEBUG_FILE_ONLY, LOG_CONFIG_ERROR, LOG_CONFIG_ERROR_CONSOLE_ONLY,
@@ -139,4 +130,88 @@ from .util import (LOG_CONFIG_CRITICAL, LOG_CONFIG_CRITICAL_CONSOLE_ONLY,
                    LOG_CONFIG_TRACE_FILE_ONLY, LOG_CONFIG_WARNING, LOG_CONFIG_WARNING_CONSOLE_ONLY,
                    LOG_CONFIG_WARNING_FILE_ONLY, Log, LogConfig, LogLevel, RuntimeTypeCheckEnable,
                    ScopedLogEnable, TraceEnable, VmbIntEnum, VmbFlagEnum)
-from .vmbsystem import VmbSystem
+
+# Everything else requires the VmbC shared library to be loaded. These names are imported on first
+# access (PEP 562) so that e.g. the logging utilities can be used without loading VmbC.
+_LAZY_IMPORTS = {
+    'AccessMode': '.camera',
+    'Camera': '.camera',
+    'CameraChangeHandler': '.camera',
+    'CameraEvent': '.camera',
+    'BoolFeature': '.feature',
+    'CommandFeature': '.feature',
+    'EnumEntry': '.feature',
+    'EnumFeature': '.feature',
+    'FeatureTypes': '.feature',
+    'FeatureVisibility': '.feature',
+    'FloatFeature': '.feature',
+    'IntFeature': '.feature',
+    'RawFeature': '.feature',
+    'StringFeature': '.feature',
+    'FeatureContainer': '.featurecontainer',
+    'ModulePersistFlags': '.featurecontainer',
+    'PersistableFeatureContainer': '.featurecontainer',
+    'PersistType': '.featurecontainer',
+    'BAYER_PIXEL_FORMATS': '.frame',
+    'BGR_PIXEL_FORMATS': '.frame',
+    'BGRA_PIXEL_FORMATS': '.frame',
+    'COLOR_PIXEL_FORMATS': '.frame',
+    'MONO_PIXEL_FORMATS': '.frame',
+    'OPENCV_PIXEL_FORMATS': '.frame',
+    'RGB_PIXEL_FORMATS': '.frame',
+    'RGBA_PIXEL_FORMATS': '.frame',
+    'YCBCR_PIXEL_FORMATS': '.frame',
+    'YUV_PIXEL_FORMATS': '.frame',
+    'AllocationMode': '.frame',
+    'Debayer': '.frame',
+    'Frame': '.frame',
+    'FrameStatus': '.frame',
+    'PayloadType': '.frame',
+    'PixelFormat': '.frame',
+    'intersect_pixel_formats': '.frame',
+    'Interface': '.interface',
+    'InterfaceChangeHandler': '.interface',
+    'InterfaceEvent': '.interface',
+    'LocalDevice': '.localdevice',
+    'FrameHandler': '.stream',
+    'Stream': '.stream',
+    'TransportLayer': '.transportlayer',
+    'TransportLayerType': '.transportlayer',
+    'VmbSystem': '.vmbsystem'
+}
+
+
+def __getattr__(name: str):
+    try:
+        module = _LAZY_IMPORTS[name]
+
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+
+    value = getattr(importlib.import_module(module, __name__), name)
+
+    # Cache the imported object. Further lookups do not go through __getattr__ again
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from .camera import AccessMode, Camera, CameraChangeHandler, CameraEvent
+    from .feature import (BoolFeature, CommandFeature, EnumEntry, EnumFeature, FeatureTypes,
+                          FeatureVisibility, FloatFeature, IntFeature, RawFeature, StringFeature)
+    from .featurecontainer import (FeatureContainer, ModulePersistFlags,
+                                   PersistableFeatureContainer, PersistType)
+    from .frame import (BAYER_PIXEL_FORMATS, BGR_PIXEL_FORMATS, BGRA_PIXEL_FORMATS,
+                        COLOR_PIXEL_FORMATS, MONO_PIXEL_FORMATS, OPENCV_PIXEL_FORMATS,
+                        RGB_PIXEL_FORMATS, RGBA_PIXEL_FORMATS, YCBCR_PIXEL_FORMATS,
+                        YUV_PIXEL_FORMATS, AllocationMode, Debayer, Frame, FrameStatus,
+                        PayloadType, PixelFormat, intersect_pixel_formats)
+    from .interface import Interface, InterfaceChangeHandler, InterfaceEvent
+    from .localdevice import LocalDevice
+    from .stream import FrameHandler, Stream
+    from .transportlayer import TransportLayer, TransportLayerType
+    from .vmbsystem import VmbSystem
@@ -36,7 +36,7 @@ from .featurecontainer import PersistableFeatureContainer
 from .frame import AllocationMode, FormatTuple, Frame, PixelFormat
 from .localdevice import LocalDevice
 from .shared import read_memory, write_memory
-from .stream import FrameHandler, Stream, StreamsList, StreamsTuple
+from .stream import FrameHandler, Stream, StreamsTuple
 from .util import (EnterContextOnCall, LeaveContextOnCall, RaiseIfInsideContext,
                    RaiseIfOutsideContext, RuntimeTypeCheckEnable, TraceEnable, VmbIntEnum)
 
@@ -83,7 +83,7 @@ class Camera(PersistableFeatureContainer):
         """Do not call directly. Access Cameras via ``vmbpy.VmbSystem`` instead."""
         super().__init__()
         self.__interface: Interface = interface
-        self.__streams: StreamsList = []
+        self.__streams: StreamsTuple = ()
         self.__local_device: LocalDevice = None  # type: ignore
         self._handle: VmbHandle = VmbHandle(0)
         self.__info: VmbCameraInfo = info
@@ -174,7 +174,7 @@ class Camera(PersistableFeatureContainer):
     @RaiseIfOutsideContext()
     def get_streams(self) -> StreamsTuple:
         """Returns a Tuple containing all instances of ``Stream`` associated with this Camera."""
-        return tuple(self.__streams)
+        return self.__streams
 
     @RaiseIfOutsideContext()
     def get_local_device(self) -> LocalDevice:
@@ -568,11 +568,11 @@ class Camera(PersistableFeatureContainer):
             raise exc from e
 
         try:
-            for i in range(self.__info.streamCount):
-                # The stream at index 0 is automatically opened
-                self.__streams.append(Stream(stream_handle=self.__info.streamHandles[i],
-                                             is_open=(i == 0),
-                                             parent_cam=self))
+            # The stream at index 0 is automatically opened
+            self.__streams = tuple(Stream(stream_handle=self.__info.streamHandles[i],
+                                          is_open=(i == 0),
+                                          parent_cam=self)
+                                   for i in range(self.__info.streamCount))
             self.__local_device = LocalDevice(self.__info.localDeviceHandle)
             self._attach_feature_accessors()
         except VmbCError as e:
@@ -605,7 +605,7 @@ class Camera(PersistableFeatureContainer):
             # VmbCameraClose must be called in any case
             call_vmb_c('VmbCameraClose', self._handle)
             self._handle = VmbHandle(0)
-            self.__streams = []
+            self.__streams = ()
             self.__local_device = None
 
     @TraceEnable()
@@ -73,6 +73,10 @@ class _BaseFeature:
         self._handle: VmbHandle = handle
         self._info: VmbFeatureInfo = info
 
+        # Name and category of a feature never change. Decode them once instead of on every access
+        self.__name: str = decode_cstr(info.name)
+        self.__category: str = decode_cstr(info.category)
+
         self.__handlers: List[ChangeHandler] = []
         self.__handlers_lock = threading.Lock()
 
@@ -87,7 +91,7 @@ class _BaseFeature:
 
     def get_name(self) -> str:
         """Get Feature Name, e.g. 'DiscoveryInterfaceEvent'"""
-        return decode_cstr(self._info.name)
+        return self.__name
 
     def get_type(self) -> Type['_BaseFeature']:
         """Get Feature Type, e.g. ``IntFeature``"""
@@ -105,7 +109,7 @@ class _BaseFeature:
 
     def get_category(self) -> str:
         """Get Feature category, e.g. '/Discovery'"""
-        return decode_cstr(self._info.category)
+        return self.__category
 
     def get_display_name(self) -> str:
         """Get lengthy Feature name e.g. 'Discovery Interface Event'"""
@@ -26,12 +26,13 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 import os
 from ctypes import byref, sizeof
+from typing import Dict
 
 from .c_binding import (ModulePersistFlags, PersistType, VmbFeaturePersistSettings,
                         _as_vmb_file_path, call_vmb_c, VmbHandle)
 from .error import VmbFeatureError
 from .feature import FeaturesTuple, FeatureTypes, FeatureTypeTypes, discover_features
-from .shared import (attach_feature_accessors, filter_features_by_category, filter_features_by_name,
+from .shared import (attach_feature_accessors, filter_features_by_category,
                      filter_features_by_type, filter_selected_features, remove_feature_accessors)
 from .util import RuntimeTypeCheckEnable, TraceEnable
 
@@ -49,12 +50,14 @@ class FeatureContainer:
     Features discovery must be performed manually by calling ``_attach_feature_accessors``. This
     should be done when an appropriate classes context is entered.  This requires that the VmbHandle
     for the object is stored in ``self._handle``. Detected features are stored in ``self._feats``
-    and attached as class members. Removing the attached features again is done via
+    and attached as class members. A lookup table from feature name to feature is kept in
+    ``self._feats_by_name``. Removing the attached features again is done via
     ``_remove_feature_accessors``. This should be done when the above mentioned context is left.
     """
     @TraceEnable()
     def __init__(self) -> None:
         self._feats: FeaturesTuple = ()
+        self._feats_by_name: Dict[str, FeatureTypes] = {}
         self._handle = VmbHandle(0)
         self.__context_cnt: int = 0
 
@@ -62,6 +65,7 @@ class FeatureContainer:
     def _attach_feature_accessors(self):
         if not self.__context_cnt:
             self._feats = discover_features(self._handle)
+            self._feats_by_name = {feat.get_name(): feat for feat in self._feats}
             attach_feature_accessors(self, self._feats)
 
         self.__context_cnt += 1
@@ -172,7 +176,7 @@ class FeatureContainer:
             VmbFeatureError:
                 If no feature is associated with ``feat_name``.
         """
-        feat = filter_features_by_name(self._feats, feat_name)
+        feat = self._feats_by_name.get(feat_name)
 
         if not feat:
             raise VmbFeatureError('Feature \'{}\' not found.'.format(feat_name))
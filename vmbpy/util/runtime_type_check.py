@@ -25,6 +25,7 @@ OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 import collections.abc
+import weakref
 from functools import wraps
 from inspect import isfunction, ismethod, signature
 from typing import Union, get_type_hints, Callable, TypeVar, Any
@@ -53,6 +54,11 @@ class RuntimeTypeCheckEnable:
     """
     _log = Log.get_instance()
 
+    # Number of parameters of callables that were passed as arguments, keyed by the underlying
+    # function. Callbacks are typically passed over and over again (e.g. once per frame), so their
+    # signature is only inspected once. Weak keys keep short lived callables collectable.
+    _param_counts: 'weakref.WeakKeyDictionary[Callable, int]' = weakref.WeakKeyDictionary()
+
     def __call__(self, func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
@@ -220,12 +226,28 @@ class RuntimeTypeCheckEnable:
             except AttributeError:
                 return False
 
-        # Examine signature of given callable
-        sig_args = signature(arg).parameters
+        # Verify Parameter list length
         hint_args = type_hint.__args__
 
-        # Verify Parameter list length
-        if len(sig_args) != len(hint_args[:-1]):
+        if self.__param_count(arg) != len(hint_args[:-1]):
             return False
 
         return True
+
+    def __param_count(self, arg) -> int:
+        # Bound methods are created anew on each attribute access. Cache by the function they wrap
+        # and account for the bound first parameter separately.
+        func = arg.__func__ if ismethod(arg) else arg
+
+        try:
+            count = RuntimeTypeCheckEnable._param_counts[func]
+
+        except KeyError:
+            count = len(signature(func).parameters)
+            RuntimeTypeCheckEnable._param_counts[func] = count
+
+        except TypeError:
+            # Object can not be weakly referenced. Examine its signature without caching
+            return len(signature(arg).parameters)
+
+        return count - 1 if ismethod(arg) else count